@@ -5,8 +5,8 @@ __all__ = [
 ]
 
 import abc
+import inspect
 import typing
-from ..utils import call_as_async
 if typing.TYPE_CHECKING:
     from blue_firmament.task.context import BaseTaskContext
 
@@ -19,6 +19,8 @@ class BaseMiddleware(abc.ABC):
     """Base class of BlueFirmament Middleware.
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def __call__(self, *, next: NextT, task_context: 'BaseTaskContext') -> typing.Union[
         None, typing.Coroutine
@@ -27,28 +29,23 @@ class BaseMiddleware(abc.ABC):
 
     @staticmethod
     def run_middlewares(middlewares: MiddlewaresT, task_context: "BaseTaskContext"):
-        return call_as_async(
-            middlewares[0], 
-            next=BaseMiddleware._get_next(middlewares, task_context=task_context), 
-            task_context=task_context
-        )
+        """Run middlewares in order.
+
+        A single ``next`` is shared by the whole chain, it advances
+        an iterator over middlewares, so no ``_get_next`` closure or
+        ``call_as_async`` wrapper is created per middleware.
+        Each middleware still awaits ``next()`` in its own frame.
+
+        Sync middlewares may return ``next()`` to continue the chain.
+        """
+        remaining = iter(middlewares)
 
-    @staticmethod
-    def _get_next(
-        middlewares: MiddlewaresT, task_context: "BaseTaskContext",
-        current: int = 0
-    ) -> NextT:
         async def _next() -> None:
-            nonlocal current
-            current += 1
-            if current < len(middlewares):
-                return await call_as_async(
-                    middlewares[current],
-                    next=BaseMiddleware._get_next(
-                        middlewares, task_context=task_context, current=current
-                    ),
-                    task_context=task_context
-                )
-            else:
+            middleware = next(remaining, None)
+            if middleware is None:
                 return None
-        return _next
+            res = middleware(next=_next, task_context=task_context)
+            if inspect.isawaitable(res):
+                await res
+
+        return _next()
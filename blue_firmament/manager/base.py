@@ -15,6 +15,9 @@ from ..scheme.field import Field
 from ..scheme import SchemeTV
 from ..log import log_manager_handler
 
+if typing.TYPE_CHECKING:
+    from ..dal.types import DALPath
+
 
 class ManagerMetaclass(abc.ABCMeta):
     """Metaclass of Manager
@@ -110,6 +113,12 @@ class BaseManager(
     - no ``manager``
     - use ``_`` and lowercase
     '''
+    __scheme_dal_path__: Opt["DALPath"] = None
+    """DALPath of managing scheme, cached on subclass creation
+    """
+    __scheme_key__: Opt[Field] = None
+    """Key field of managing scheme, cached on subclass creation
+    """
 
     def __init_subclass__(
         cls,
@@ -120,6 +129,12 @@ class BaseManager(
             cls.__scheme_cls__ = scheme_cls
         cls.__manager_name__ = manager_name
 
+        # scheme's dal path and key are fixed once scheme class created
+        managing_scheme_cls = getattr(cls, '__scheme_cls__', None)
+        if managing_scheme_cls is not None:
+            cls.__scheme_dal_path__ = managing_scheme_cls.__dal_path__
+            cls.__scheme_key__ = managing_scheme_cls.__key__
+
         super().__init_subclass__()
 
     def __init__(self, task_context: BaseTaskContext) -> None:
@@ -136,14 +151,18 @@ class BaseManager(
         return self.__scheme_cls__
     
     @property
-    def _dal_path(self):
+    def _dal_path(self) -> "DALPath":
         """DALPath of managing scheme"""
-        return self._scheme_cls.dal_path()
+        if self.__scheme_dal_path__ is None:
+            return self._scheme_cls.dal_path()  # raise
+        return self.__scheme_dal_path__
 
     @property
     def _scheme_key(self) -> Field:
         """Key field of managing scheme"""
-        return self._scheme_cls.get_key_field()
+        if self.__scheme_key__ is None:
+            return self._scheme_cls.get_key_field()  # raise
+        return self.__scheme_key__
 
     @property
     def _scheme(self) -> SchemeTV:
@@ -252,7 +252,7 @@ class CommonManager(
         self._scheme = await self._dao.insert(
             to_insert=scheme or await self._get_scheme(),
             exclude_key=(False 
-                if self._scheme_cls.get_key_field().is_natural_key() 
+                if self._scheme_key.is_natural_key() 
                 else True
             )
         )
@@ -282,7 +282,7 @@ class CommonManager(
         scheme = self._try_get_scheme()
         if not scheme:
             return await self._dao.select_one(
-                self._scheme_cls.get_key_field().equals(_id),
+                self._scheme_key.equals(_id),
                 field=field, 
                 task_context=self
             )
@@ -8,13 +8,20 @@ __all__ = [
 
 import typing
 from typing import Optional as Opt, Annotated as Anno, Literal as Lit
-from blue_firmament.dal.base import DataAccessLayer
-from blue_firmament.dal.types import DALPath
 from ..dal.types import KeyableType
 from .field import field, Field as FieldT
+from .converter import get_converter_from_anno
 from .main import BaseScheme, NoProxyScheme
 
 
+_INSERTED_CHECKS: typing.Dict[type, typing.Callable[[typing.Any], bool]] = {
+    int: bool,  # != 0
+    str: bool,  # != ''
+}
+"""Fast path of ``BusinessScheme._inserted``, keyed by exact key type
+"""
+
+
 KeyTV = typing.TypeVar('KeyTV', bound=KeyableType)
 class BusinessScheme(
     typing.Generic[KeyTV],
@@ -23,16 +30,18 @@ class BusinessScheme(
     
     def __init_subclass__(cls, 
         key_type: Opt[typing.Type] = None,
-        dal_path: DALPath | None = None,
-        dal: type[DataAccessLayer] | None = None,
-        proxy: bool | None = None,
-        disable_log: bool | None = None,
-        partial: bool | None = None,
-        inherit_validators: bool | None = None
+        **kwargs
     ) -> None:
-        super().__init_subclass__(dal_path, dal, proxy, disable_log, partial, inherit_validators)
+        """
+        :param key_type: Type of ``_id``, sets its converter.
+
+        Scheme options (``dal_path``, ``proxy``...) are consumed by
+        :class:`SchemeMetaclass` and never reach here.
+        """
+        super().__init_subclass__(**kwargs)
         if key_type:
-            cls._id._set_converter_from_anno(key_type)
+            # _id inherited converter (from KeyTV) is already set, override
+            cls._id._set_converter(get_converter_from_anno(key_type), force=True)
 
     _id: FieldT[KeyTV] = field(is_key=True)
 
@@ -55,6 +64,11 @@ class BusinessScheme(
         >>> BusinessScheme(_id=CID(ida=1, idb='cc'))._inserted
         True
         """
+        check = _INSERTED_CHECKS.get(type(self._id))
+        if check is not None:
+            return check(self._id)
+
+        # subclasses of key types
         if isinstance(self._id, int):
             return self._id != 0
         elif isinstance(self._id, str):
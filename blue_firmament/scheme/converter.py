@@ -5,7 +5,9 @@
 """
 
 import abc
+import copy
 import datetime
+import functools
 import typing
 import enum
 import types
@@ -25,6 +27,28 @@ SchemeTV = typing.TypeVar('SchemeTV', bound='BaseScheme')
 EnumMemberTV = typing.TypeVar('EnumMemberTV', bound=enum.Enum)
 ConverterResultTV = typing.TypeVar('ConverterResultTV')
 ConverterModeT = typing.Literal['base'] | typing.Literal['strict']
+_JSON_DUMPABLE_TYPES: typing.Dict[type, bool] = {}
+"""Cache of :func:`is_json_dumpable` by value type (it only checks type)
+"""
+
+
+def _compile_positional(
+    converters: typing.Sequence[typing.Callable],
+    constructor: Opt[typing.Callable] = None
+) -> typing.Callable[[typing.Sequence], typing.Any]:
+    
+    """Generate ``f(v)`` which converts ``v[i]`` with ``converters[i]``
+    (unrolled, no loop), and passes results to ``constructor``
+    positionally (a tuple if not provided)
+    """
+    namespace: typing.Dict[str, typing.Any] = {'_cls': constructor}
+    namespace.update((f'_c{i}', c) for i, c in enumerate(converters))
+    args = ''.join(f'_c{i}(v[{i}]), ' for i in range(len(converters)))
+    body = f'({args})' if constructor is None else f'_cls({args})'
+    exec(f"def convert(v):\n    return {body}\n", namespace)
+    return namespace['convert']
+
+
 class ConverterProtocol(typing.Protocol):
 
     def __call__(self, value: typing.Any) -> typing.Any:
@@ -61,13 +85,24 @@ class BaseConverter(typing.Generic[ConverterResultTV], abc.ABC):
 
     """
 
+    __slots__ = ('_mode', '_is_base', '_is_strict')
+
     def __init__(self, mode: ConverterModeT = 'base') -> None:
         self.mode = mode
 
     @property
-    def is_base(self): return self.mode == 'base'
+    def mode(self) -> ConverterModeT: return self._mode
+    @mode.setter
+    def mode(self, mode: ConverterModeT):
+        """Also refresh ``_is_base``, ``_is_strict`` read by ``__call__``"""
+        self._mode = mode
+        self._is_base = mode == 'base'
+        self._is_strict = mode == 'strict'
+
+    @property
+    def is_base(self): return self._is_base
     @property
-    def is_strict(self): return self.mode == 'strict'
+    def is_strict(self): return self._is_strict
 
     @property
     @abc.abstractmethod
@@ -80,6 +115,13 @@ class BaseConverter(typing.Generic[ConverterResultTV], abc.ABC):
         """转换值
         """
         raise NotImplementedError('`__call__` method must be implemented in subclass')
+
+    def call_many(self, values: typing.Iterable) -> typing.List[ConverterResultTV]:
+        """批量转换值
+
+        容器转换器通过它转换元素，子类可以重写以整体处理
+        """
+        return list(map(self, values))
     
     def dump(self, value: ConverterResultTV) -> typing.Any:
 
@@ -96,10 +138,14 @@ class BaseConverter(typing.Generic[ConverterResultTV], abc.ABC):
 
         """Dump value to jsonable value
         """
-        if is_json_dumpable(value):
+        tp = type(value)
+        dumpable = _JSON_DUMPABLE_TYPES.get(tp)
+        if dumpable is None:
+            dumpable = _JSON_DUMPABLE_TYPES[tp] = is_json_dumpable(value)
+        if dumpable:
             return value
         else:
-            raise TypeError("cannot dump type %s" % type(value))
+            raise TypeError("cannot dump type %s" % tp)
     
 
 def get_converter_from_anno(
@@ -110,6 +156,9 @@ def get_converter_from_anno(
 
     Behaviour
     ---------
+    - 同一（可哈希的）类型注释返回同一转换器实例（有上限的 LRU 缓存），
+      需要修改转换器（如 ``mode``）时请先复制；
+      测试中可以通过 ``get_converter_from_anno.cache_clear()`` 清空缓存
     - 找不到合适的校验器则返回通用校验器 :class:`AnyConverter`
     - 支持枚举、数据模型
     - 支持 NewType, UnionType, Annotated, Optional
@@ -126,40 +175,35 @@ def get_converter_from_anno(
     >>> get_converter_from_anno(typing.Optional[str])
     OptionalConveter[str]
     """
+    try:
+        return _get_converter_from_anno_cached(tp)
+    except TypeError:
+        # e.g. Annotated with unhashable metadata, resolve without cache
+        # (errors raised while resolving are raised again here)
+        return _get_converter_from_anno(tp)
+
+
+def _get_converter_from_anno(tp: typing.Type) -> BaseConverter:
     from .main import BaseScheme
 
+    # plain builtin types, no need to resolve origin
+    factory = _CONVERTER_FACTORIES.get(tp) if isinstance(tp, type) else None
+    if factory is not None:
+        return factory(tp)
+
     ortp = get_origin(tp)
+    factory = _CONVERTER_FACTORIES.get(ortp)
+    if factory is not None:
+        return factory(tp)
+
     if safe_issubclass(ortp, BaseScheme):
         return SchemeConverter(ortp)
     if safe_issubclass(ortp, enum.Enum):
         return EnumConverter(ortp)
-
-    if ortp is int:
-        return IntConverter()
-    if ortp is float:
-        return FloatConverter()
-    if ortp is str:
-        return StrConverter()
-    if ortp is None:
-        return NoneConverter()
-    if ortp is datetime.datetime:
-        return DatetimeConverter()
-    if ortp is set:
-        return SetConverter(
-            element_type=typing.get_args(tp)[0]
-        )
-    if ortp is dict:
-        return DictConverter(
-            value_type=typing.get_args(tp)[0]
-        )
     if is_namedtuple(ortp):
         return NamedTupleConveter(
             namedtuple_type=tp
         )
-    if ortp is tuple:
-        return TupleConverter(
-            tuple_type=tp
-        )
 
     # parse union type and optional type
     if typing.get_origin(tp) is typing.Union:
@@ -175,6 +219,16 @@ def get_converter_from_anno(
     return AnyConverter()
 
 
+_CONVERTER_CACHE_SIZE = 1024
+"""Max annotations whose converter is cached; bounded since the cache
+keeps resolved (maybe dynamically created) scheme and enum classes alive
+"""
+_get_converter_from_anno_cached = functools.lru_cache(maxsize=_CONVERTER_CACHE_SIZE)(
+    _get_converter_from_anno
+)
+get_converter_from_anno.cache_clear = _get_converter_from_anno_cached.cache_clear  # type: ignore
+
+
 
 @singleton
 class AnyConverter(BaseConverter[typing.Any]):
@@ -185,8 +239,13 @@ class AnyConverter(BaseConverter[typing.Any]):
     不做任何转换，只是返回原值
     """
     
+    __slots__ = ()
+
     def __call__(self, value: typing.Any, **kwargs) -> typing.Any: 
         return value
+
+    def call_many(self, values: typing.Iterable) -> typing.List[typing.Any]:
+        return list(values)
     
     @property
     def type(self): return typing.Type[typing.Any]
@@ -197,6 +256,8 @@ class SchemeConverter(BaseConverter[SchemeTV], typing.Generic[SchemeTV]):
     """数据模型转换器
     """
 
+    __slots__ = ('scheme_cls', '_from_row')
+
     def __init__(self, 
         scheme_cls: typing.Type[SchemeTV],
         mode: ConverterModeT = 'base'
@@ -204,6 +265,7 @@ class SchemeConverter(BaseConverter[SchemeTV], typing.Generic[SchemeTV]):
         
         super().__init__(mode)
         self.scheme_cls = scheme_cls
+        self._from_row = scheme_cls.from_row
 
     def __call__(self, value: dict | SchemeTV, **kwargs) -> SchemeTV:
 
@@ -214,11 +276,11 @@ class SchemeConverter(BaseConverter[SchemeTV], typing.Generic[SchemeTV]):
             - _request_context: 请求上下文
         """
         if isinstance(value, dict):
-            return self.scheme_cls(**value, **kwargs)
-        else:
-            for k, v in kwargs:
-                value[k] = v
-            return value
+            return self._from_row(value, **kwargs)
+        # already an instance, no need to validate again
+        for k, v in kwargs.items():
+            value[k] = v
+        return value
 
     @property
     def type(self): return self.scheme_cls
@@ -232,6 +294,8 @@ class EnumConverter(BaseConverter[EnumMemberTV], typing.Generic[EnumMemberTV]):
     """枚举转换器
     """
 
+    __slots__ = ('enum_cls', '_lookup')
+
     def __init__(self, 
         enum_cls: typing.Type[EnumMemberTV],
         mode: ConverterModeT = 'base'
@@ -239,8 +303,19 @@ class EnumConverter(BaseConverter[EnumMemberTV], typing.Generic[EnumMemberTV]):
         
         super().__init__(mode)
         self.enum_cls = enum_cls
+        self._lookup: typing.Dict[typing.Any, EnumMemberTV] = getattr(
+            enum_cls, '_value2member_map_', {}
+        )
+        """Enum 自身的值-成员映射，命中时绕过 ``EnumMeta.__call__``"""
 
     def __call__(self, value, **kwargs) -> EnumMemberTV:
+        try:
+            member = self._lookup.get(value)
+        except TypeError:  # unhashable value
+            member = None
+        if member is not None:
+            return member
+        # 未命中时仍走 Enum 本身，保留 _missing_ 等语义
         return self.enum_cls(value)
     
     @property
@@ -251,6 +326,8 @@ class EnumConverter(BaseConverter[EnumMemberTV], typing.Generic[EnumMemberTV]):
 
 class EnumValueConverter(BaseConverter):
 
+    __slots__ = ()
+
     def __call__(self, value, **kwargs) -> typing.Any:
         if not isinstance(value, enum.Enum):
             raise ValueError("not enum member")
@@ -266,36 +343,83 @@ class UnionConverter(BaseConverter):
     """联合类型转换器
 
     只要一组转换器中有一个转换成功就有效（子转换器为严格模式）
+
+    值的类型正好是某个子转换器的结果类型时，直接使用该子转换器，
+    不再逐个尝试
     """
 
+    __slots__ = ('sub_conveters', '_type_map', 'adaptive', '_order', '_hits', '_calls', '_type')
+
+    REORDER_INTERVAL: typing.ClassVar[int] = 1024
+    """Successful conversions between two reorders (adaptive only)"""
+
     def __init__(self, 
         *types_: typing.Type,
-        mode: ConverterModeT = 'base'
+        mode: ConverterModeT = 'base',
+        adaptive: bool = False
     ) -> None:
+        """
+        :param adaptive: 按转换成功次数调整子转换器的尝试顺序
+
+            会改变声明的优先级，仅在一个值最多只能被一个子转换器接受时使用
+        """
         super().__init__(mode)
+        self.adaptive = adaptive
+        self._type = None
 
         self.sub_conveters = []
         for type_ in types_:
-            converter = get_converter_from_anno(type_)
+            # copy: converters from annotation are shared
+            converter = copy.copy(get_converter_from_anno(type_))
             converter.mode = 'strict'
             self.sub_conveters.append(converter)
 
+        self._type_map: typing.Dict[type, BaseConverter] = {}
+        """Result type -> sub converter, first one wins"""
+        for converter in self.sub_conveters:
+            if isinstance(converter.type, type):
+                self._type_map.setdefault(converter.type, converter)
+
+        self._order: typing.Tuple[int, ...] = tuple(range(len(self.sub_conveters)))
+        """Indices of sub converters, in trying order"""
+        self._hits: typing.List[int] = [0] * len(self.sub_conveters)
+        self._calls = 0
+
     def __call__(self, value: typing.Any, **kwargs) -> typing.Any:
 
-        for converter in self.sub_conveters:  # 将频次较高的放在前面，效率就更高
+        converter = self._type_map.get(type(value))
+        if converter is not None:
             try:
                 return converter(value)
+            except ValueError:
+                pass
+
+        for i in self._order:  # 将频次较高的放在前面，效率就更高
+            try:
+                result = self.sub_conveters[i](value)
             except ValueError:
                 continue
+            if self.adaptive:
+                self._hits[i] += 1
+                self._calls += 1
+                if self._calls % self.REORDER_INTERVAL == 0:
+                    self._order = tuple(sorted(
+                        self._order, key=self._hits.__getitem__, reverse=True
+                    ))
+            return result
 
     @property
     def type(self): 
-        return typing.Type[
-            typing.Union[*tuple(validator.type for validator in self.sub_conveters)]
-        ]
+        if self._type is None:  # 子转换器在初始化后不再变化
+            self._type = typing.Type[
+                typing.Union[*tuple(validator.type for validator in self.sub_conveters)]
+            ]
+        return self._type
 
 class OptionalConveter(BaseConverter[typing.Optional[ConverterResultTV]]):
 
+    __slots__ = ('sub_converter', '_type')
+
     def __init__(self, 
         tp: Undefined | typing.Type[ConverterResultTV] = _undefined,
         tp_converter: Opt[BaseConverter[ConverterResultTV]] = None,
@@ -307,16 +431,24 @@ class OptionalConveter(BaseConverter[typing.Optional[ConverterResultTV]]):
             if tp is _undefined:
                 raise ValueError('`tp` or `tp_converter` must be provided')
             self.sub_converter = get_converter_from_anno(tp)
+        else:
+            self.sub_converter = tp_converter
+        self._type = None
 
     def __call__(self, value, **kwargs) -> ConverterResultTV | types.NoneType:
         
-        try:
-            NoneConverter()(value)
-        except ValueError:
-            return self.sub_converter(value)
+        # same as NoneConverter (base mode), inlined
+        if value is None:
+            return None
+        if isinstance(value, str) and value == 'null':
+            return None
+        return self.sub_converter(value)
         
     @property
-    def type(self): return typing.Type[typing.Optional[self.sub_converter.type]]
+    def type(self): 
+        if self._type is None:
+            self._type = typing.Type[typing.Optional[self.sub_converter.type]]
+        return self._type
 
 class IntConverter(BaseConverter[int]):
     
@@ -329,6 +461,8 @@ class IntConverter(BaseConverter[int]):
     - 奇偶性
     """
 
+    __slots__ = ('ge', 'le', '_has_constraints')
+
     def __init__(self, 
         ge: Opt[int] = None, le: Opt[int] = None,
         mode: ConverterModeT = 'base'
@@ -338,15 +472,29 @@ class IntConverter(BaseConverter[int]):
 
         self.ge = ge
         self.le = le
+        self._has_constraints = ge is not None or le is not None
 
     def __call__(self, value: typing.Any, **kwargs) -> int:
         
-        res = int(value)
+        res = value if type(value) is int else int(value)
+        if not self._has_constraints:
+            return res
         if self.ge is not None and res <= self.ge:
             raise ValueError(f'Value {res} is less than minimum {self.ge}')
         if self.le is not None and res >= self.le:
             raise ValueError(f'Value {res} is greater than maximum {self.le}')
         return res
+
+    def call_many(self, values: typing.Iterable) -> typing.List[int]:
+        
+        results = list(map(int, values))
+        if results and self._has_constraints and (
+            (self.ge is not None and min(results) <= self.ge) or
+            (self.le is not None and max(results) >= self.le)
+        ):
+            for res in results:
+                self(res)  # raise the same error as __call__
+        return results
     
     @property
     def type(self): return int
@@ -359,6 +507,8 @@ class FloatConverter(BaseConverter[float]):
     - number range
     """
 
+    __slots__ = ('gt', 'ge', 'lt', 'le', '_has_constraints')
+
     def __init__(self, 
         gt: Opt[float] = None, ge: Opt[float] = None, 
         lt: Opt[float] = None, le: Opt[float] = None,
@@ -375,15 +525,20 @@ class FloatConverter(BaseConverter[float]):
         self.lt = lt
         self.ge = ge
         self.le = le
+        self._has_constraints = any(
+            i is not None for i in (gt, lt, ge, le)
+        )
 
     def __call__(self, value: typing.Any, **kwargs) -> float:
         
         if not isinstance(value, float):
-            if self.is_base:
+            if self._is_base:
                 value = float(value)
             else:
                 raise ValueError(f'Value {value} is not float')
         
+        if not self._has_constraints:
+            return value
         if self.ge is not None and value <= self.ge:
             raise ValueError(f'Value {value} is less than minimum {self.ge}')
         if self.le is not None and value >= self.le:
@@ -403,6 +558,8 @@ class StrConverter(BaseConverter[str]):
     """字符串转换器
     """
 
+    __slots__ = ('min_len', 'max_len', 'allow_empty', 'half_as_unit', '_has_constraints')
+
     def __init__(self, 
         min: Opt[int] = None, max: Opt[int] = None,
         allow_empty: bool = False,
@@ -426,25 +583,29 @@ class StrConverter(BaseConverter[str]):
         self.max_len = max
         self.allow_empty = allow_empty
         self.half_as_unit = half_as_unit
+        self._has_constraints = min is not None or max is not None
 
     def get_length(self, value: str) -> int:
         """获取字符串长度
         """
-        if self.half_as_unit:
-            return len(value)
-        else:
-            return sum(2 if ord(i) > 255 else 1 for i in value) # TESTME 
+        length = len(value)
+        if self.half_as_unit or value.isascii():
+            return length
+        # code points above 255 are dropped by latin-1 encoding, count them twice
+        return 2 * length - len(value.encode('latin-1', 'ignore'))
 
     def __call__(self, value, **kwargs) -> str:
         
         res = ''
-        if self.is_base:
+        if self._is_base:
             res = str(value)
-        if self.is_strict:
+        if self._is_strict:
             if not isinstance(value, str):
                 raise ValueError(f'Value {value} is not str')
             res = value
 
+        if not self._has_constraints:
+            return res
         length = self.get_length(res)
         if self.min_len is not None and length < self.min_len:
             if length == 0 and self.allow_empty:
@@ -475,10 +636,12 @@ class NoneConverter(BaseConverter[None]):
     - 'undefined'
     """
 
+    __slots__ = ()
+
     def __call__(self, value: typing.Any, **kwargs) -> None:
 
         if value is not None:
-            if self.is_base:
+            if self._is_base:
                 # try from string
                 if isinstance(value, str):
                     if value == 'null':
@@ -502,6 +665,8 @@ class TupleConverter(
     按照顺序校验每个元素的值，长度必须一致
     """
 
+    __slots__ = ('sub_converters', '__length', '__convert', '_type', '_passthrough')
+
     def __init__(self, 
         tuple_type: typing.Type[tuple[typing.Unpack[TupleValueTV]]],
         mode: ConverterModeT = 'base'
@@ -512,31 +677,40 @@ class TupleConverter(
             get_converter_from_anno(type_) 
             for type_ in typing.get_args(tuple_type)
         )
+        self.__length = len(self.sub_converters)
+        self.__convert = _compile_positional(self.sub_converters)
+        self._type = None
+        any_converter = AnyConverter()  # singleton
+        self._passthrough = all(c is any_converter for c in self.sub_converters)
+        """All elements are Any, a tuple of the right length is returned as is"""
 
     def __call__(self, value, **kwargs) -> tuple[typing.Unpack[TupleValueTV]]:
         
         if not isinstance(value, tuple):
-            if self.is_base:
-                value = tuple(value)
+            if not self._is_base:
+                raise ValueError(f"Value {value} is not tuple")
+            value = tuple(value)
 
-        if len(value) != len(self.sub_converters):
-            raise ValueError(f'Value {value} is not a tuple of length {len(self.sub_converters)}')
+        if len(value) != self.__length:
+            raise ValueError(f'Value {value} is not a tuple of length {self.__length}')
         
-        return tuple(
-            validator(value[i]) 
-            for i, validator in enumerate(self.sub_converters)
-        )
+        if self._passthrough:
+            return value
+        return self.__convert(value)
     
     @property
-    def type(self): return typing.Tuple[*tuple(
-        validator.type 
-        for validator in self.sub_converters
-    )]
+    def type(self): 
+        if self._type is None:
+            self._type = typing.Tuple[*tuple(
+                validator.type 
+                for validator in self.sub_converters
+            )]
+        return self._type
 
     def dump_to_jsonable(self, value) -> tuple: 
         return tuple(
-            self.sub_converters[i].dump_to_jsonable(value[i])
-            for i in range(len(value))
+            validator.dump_to_jsonable(i)
+            for validator, i in zip(self.sub_converters, value)
         )
     
 
@@ -544,16 +718,22 @@ class NamedTupleConveter(BaseConverter[NamedTupleTV], typing.Generic[NamedTupleT
     """带名元组转换器
     """
 
+    __slots__ = ('namedtuple_cls', 'sub_validators', '__construct', '__length')
+
     def __init__(self, 
         namedtuple_type: typing.Type[NamedTupleTV],
         mode: ConverterModeT = 'base'
     ):
         super().__init__(mode)
         self.namedtuple_cls: typing.Type[NamedTupleTV] = namedtuple_type
+        self.__length = len(self.namedtuple_cls._fields)
         self.sub_validators = tuple(
             get_converter_from_anno(i)
             for i in self.namedtuple_cls.__annotations__.values()
         )
+
+        self.__construct: typing.Callable[[tuple], NamedTupleTV] = \
+            _compile_positional(self.sub_validators, self.namedtuple_cls)
     
     def __call__(self, value, **kwargs) -> NamedTupleTV:
 
@@ -561,19 +741,14 @@ class NamedTupleConveter(BaseConverter[NamedTupleTV], typing.Generic[NamedTupleT
             return value
         
         if not isinstance(value, tuple):
-            value = TupleConverter(typing.Tuple[typing.Any, ...])(value)
+            value = tuple(value)
         
-        if len(value) != len(self.namedtuple_cls._fields):
-            raise ValueError(f"Value {value} is not a namedtuple of length {len(self.namedtuple_cls._fields)}")
+        if len(value) != self.__length:
+            raise ValueError(f"Value {value} is not a namedtuple of length {self.__length}")
         
         # TODO support default value
         
-        converted_values = tuple(
-            self.sub_validators[i](value[i])
-            for i in range(len(value))
-        )
-        return self.namedtuple_cls(*converted_values) # type: ignore
-        # FIXME type issue
+        return self.__construct(value)
     
     @property
     def type(self): return self.namedtuple_cls
@@ -590,6 +765,8 @@ class SetConverter(BaseConverter[typing.Set[T]], typing.Generic[T]):
     - 集合元素类型
     """
 
+    __slots__ = ('sub_conveter',)
+
     def __init__(self, 
         element_type: typing.Type[T],
         mode: ConverterModeT = 'base'
@@ -602,17 +779,12 @@ class SetConverter(BaseConverter[typing.Set[T]], typing.Generic[T]):
         
         # is a set
         if not isinstance(value, set):
-            if self.is_base:
-                value = set(value)
-            
-            raise ValueError(f"Value {value} is not set")
+            if not self._is_base:
+                raise ValueError(f"Value {value} is not set")
+            value = set(value)
         
         # validate element type
-        new_value: typing.Set[T] = set()
-        for i in value:
-            new_value.add(self.sub_conveter(i))
-        
-        return new_value
+        return set(self.sub_conveter.call_many(value))
     
     def dump(self, value: set) -> tuple:
         return tuple(
@@ -645,6 +817,8 @@ class ListConverter(BaseConverter[typing.List[T]], typing.Generic[T]):
         - 如果不是简单元素，需要指定标识符获取器
     """
 
+    __slots__ = ('min_len', 'max_len', 'sub_converter', '_has_constraints', '_type')
+
     def __init__(self, 
         element_type: typing.Type[T],
         min_len: Opt[int] = None, max_len: Opt[int] = None,
@@ -654,36 +828,40 @@ class ListConverter(BaseConverter[typing.List[T]], typing.Generic[T]):
 
         self.min_len = min_len
         self.max_len = max_len
+        self._has_constraints = min_len is not None or max_len is not None
+        self._type = None
         converter = get_converter_from_anno(element_type)
-        converter.mode = mode
+        if converter.mode != mode:
+            # copy: converters from annotation are shared
+            converter = copy.copy(converter)
+            converter.mode = mode
         self.sub_converter: BaseConverter[T] = converter
 
     def __call__(self, value, **kwargs) -> typing.List[T]:
 
         # is a list
         if not isinstance(value, list):
-            if self.is_base:
-                value = list(value)
-            
-            raise ValueError(f"Value {value} is not list")
+            if not self._is_base:
+                raise ValueError(f"Value {value} is not list")
+            value = list(value)
         
         # validate length
-        length = len(value)
-        if self.min_len is not None and length < self.min_len:
-            # TODO use (Container)LengthError
-            raise ValueError(f'Value {value} is less than minimum length {self.min_len}')
-        if self.max_len is not None and length > self.max_len:
-            raise ValueError(f'Value {value} is greater than maximum length {self.max_len}')
+        if self._has_constraints:
+            length = len(value)
+            if self.min_len is not None and length < self.min_len:
+                # TODO use (Container)LengthError
+                raise ValueError(f'Value {value} is less than minimum length {self.min_len}')
+            if self.max_len is not None and length > self.max_len:
+                raise ValueError(f'Value {value} is greater than maximum length {self.max_len}')
 
         # validate element type
-        new_value: typing.List[T] = []
-        for i in value:
-            new_value.append(self.sub_converter(i))
-        
-        return new_value
+        return self.sub_converter.call_many(value)
     
     @property
-    def type(self): return typing.List[self.sub_converter.type]
+    def type(self): 
+        if self._type is None:
+            self._type = typing.List[self.sub_converter.type]
+        return self._type
 
     def dump_to_jsonable(self, value) -> list:
         return [
@@ -692,6 +870,11 @@ class ListConverter(BaseConverter[typing.List[T]], typing.Generic[T]):
         ]
         
 
+_datetime_fromisoformat = datetime.datetime.fromisoformat
+_datetime_fromtimestamp = datetime.datetime.fromtimestamp
+_time_fromisoformat = datetime.time.fromisoformat
+
+
 class DatetimeConverter(BaseConverter[datetime.datetime]):
 
     """日期时间转换器
@@ -699,14 +882,18 @@ class DatetimeConverter(BaseConverter[datetime.datetime]):
     是否为 datetime.datetime 对象
     """
 
+    __slots__ = ()
+
     def __call__(self, value, **kwargs) -> datetime.datetime:
         
+        if type(value) is datetime.datetime:
+            return value
         if not isinstance(value, datetime.datetime):
-            if self.is_base:
+            if self._is_base:
                 if isinstance(value, str):
-                    return datetime.datetime.fromisoformat(value)
+                    return _datetime_fromisoformat(value)
                 if isinstance(value, (int, float)):
-                    return datetime.datetime.fromtimestamp(value)
+                    return _datetime_fromtimestamp(value)
                 
             raise ValueError(f"Value {value} is not datetime.datetime obj")
         
@@ -732,12 +919,16 @@ class TimeConverter(BaseConverter[datetime.time]):
     是否为 datetime.time 对象
     """
 
+    __slots__ = ()
+
     def __call__(self, value, **kwargs) -> datetime.time:
         
+        if type(value) is datetime.time:
+            return value
         if not isinstance(value, datetime.time):
-            if self.is_base:
+            if self._is_base:
                 if isinstance(value, str):
-                    return datetime.time.fromisoformat(value)
+                    return _time_fromisoformat(value)
                 
             raise ValueError(f"Value {value} is not datetime.time obj")
         
@@ -765,6 +956,8 @@ class DictConverter(BaseConverter[typing.Dict[typing.Any, T]], typing.Generic[T]
     - 字典值类型
     """
 
+    __slots__ = ('value_conveter',)
+
     def __init__(self, 
         value_type: typing.Type[T],
         mode: ConverterModeT = 'base'
@@ -777,24 +970,55 @@ class DictConverter(BaseConverter[typing.Dict[typing.Any, T]], typing.Generic[T]
 
         # is a dict
         if not isinstance(value, dict):
-            if self.is_base:
-                value = dict(value)
-            
-            raise ValueError(f"Value {value} is not dict")
+            if not self._is_base:
+                raise ValueError(f"Value {value} is not dict")
+            value = dict(value)
         
         # validate element type
-        new_value: typing.Dict[typing.Any, T] = {}
-        for k, v in value.items():
-            new_value[k] = self.value_conveter(v)
-        
-        return new_value
+        return dict(zip(value.keys(), self.value_conveter.call_many(value.values())))
     
     @property
     def type(self): 
         return typing.Dict[typing.Any, self.value_conveter.type]
     
     def dump_to_jsonable(self, value) -> dict[str, JsonDumpable]: 
+        dump_value = self.value_conveter.dump_to_jsonable
         return {
-            str(k): self.value_conveter.dump_to_jsonable(v)
+            k if type(k) is str else str(k): dump_value(v)
             for k, v in value.items()
         }
+
+
+def _get_type_arg(tp: typing.Type, index: int) -> typing.Any:
+    """Get ``index``-th type argument, ``typing.Any`` if not parameterized
+    """
+    args = typing.get_args(tp)
+    return args[index] if len(args) > index else typing.Any
+
+
+# Leaf converters with default arguments are stateless, share them
+# (callers changing ``mode`` copy first)
+_INT_CONVERTER = IntConverter()
+_FLOAT_CONVERTER = FloatConverter()
+_STR_CONVERTER = StrConverter()
+_DATETIME_CONVERTER = DatetimeConverter()
+_TIME_CONVERTER = TimeConverter()
+
+
+_CONVERTER_FACTORIES: typing.Dict[
+    typing.Any, typing.Callable[[typing.Any], BaseConverter]
+] = {
+    int: lambda tp: _INT_CONVERTER,
+    float: lambda tp: _FLOAT_CONVERTER,
+    str: lambda tp: _STR_CONVERTER,
+    None: lambda tp: NoneConverter(),
+    types.NoneType: lambda tp: NoneConverter(),
+    datetime.datetime: lambda tp: _DATETIME_CONVERTER,
+    datetime.time: lambda tp: _TIME_CONVERTER,
+    set: lambda tp: SetConverter(element_type=_get_type_arg(tp, 0)),
+    dict: lambda tp: DictConverter(value_type=_get_type_arg(tp, 1)),
+    tuple: lambda tp: TupleConverter(tuple_type=tp),
+}
+"""Converter factories keyed by exact origin type,
+looked up by :func:`get_converter_from_anno` before the subclass checks
+"""
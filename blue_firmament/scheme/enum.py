@@ -59,3 +59,35 @@ class Status(enum.Enum):
             if self not in allowed_from:
                 raise InvalidStatusTransition.from_enum_member(self, target)
         return target
+
+
+def transition(
+    target: EnumMemberTV,
+    *allowed_from: "Status",
+) -> typing.Callable[["Status"], EnumMemberTV]:
+    
+    """Build a status transition method
+
+    Same as :meth:`Status._to_target_status`, but ``allowed_from`` is
+    frozen into a set once, when the method is built.
+
+    Members do not exist yet inside the class body, so assign the
+    method after the class is defined.
+
+    Examples
+    --------
+    .. code-block:: python
+        MyStatus.to_cancelled = transition(MyStatus.CANCELLED, MyStatus.OPEN)
+
+        MyStatus.OPEN.to_cancelled()
+        # return MyStatus.CANCELLED
+    """
+    allowed = frozenset(allowed_from)
+
+    def _transition(self: "Status") -> EnumMemberTV:
+        if self is not target and self not in allowed:
+            raise InvalidStatusTransition.from_enum_member(self, target)
+        return target
+    
+    _transition.__name__ = f'to_{target.name.lower()}'
+    return _transition
@@ -11,9 +11,13 @@ __all__ = [
     "private_field",
     "get_default",
     "dump_field_name",
+    "dump_flag_mask",
 ]
 
 import functools
+import inspect
+import sys
+import types
 import typing
 from typing import Optional as Opt
 from .._types import Undefined, _undefined
@@ -29,7 +33,193 @@ if typing.TYPE_CHECKING:
     from .validator import BaseValidator
 
 
+def _intern(name: Opt[str]) -> Opt[str]:
+    return sys.intern(name) if type(name) is str else name
+
+
+_DUMP_FLAG_BITS: typing.Dict[str, int] = {}
+"""Dump flag -> its bit, assigned on first sight"""
+
+
+def dump_flag_mask(flags: typing.Iterable[str]) -> int:
+
+    """Pack dump flags into an int mask
+
+    ``flags_a.issuperset(flags_b)`` <=> ``mask_a & mask_b == mask_b``
+    """
+    mask = 0
+    for flag in flags:
+        bit = _DUMP_FLAG_BITS.get(flag)
+        if bit is None:
+            bit = _DUMP_FLAG_BITS[flag] = 1 << len(_DUMP_FLAG_BITS)
+        mask |= bit
+    return mask
+
+
+@functools.lru_cache(maxsize=None)
+def _validators_template(count: int) -> typing.Callable[..., typing.Callable]:
+
+    """Compile (once per validator count) a factory
+    ``make(_v0, _v1, ...) -> validate(value, scheme_ins)``
+    which calls every validator in order (unrolled, no loop)
+    """
+    params = ', '.join(f'_v{i}' for i in range(count))
+    body = ''.join(
+        f'        _v{i}(value, scheme_ins=scheme_ins)\n' for i in range(count)
+    )
+    namespace: typing.Dict[str, typing.Any] = {}
+    exec(
+        f"def make({params}):\n"
+        f"    def validate(value, scheme_ins):\n{body}"
+        f"    return validate\n",
+        namespace
+    )
+    return namespace['make']
+
+
+def _compile_validators(
+    validators: typing.Sequence["BaseValidator"]
+) -> Opt[typing.Callable[[typing.Any, Opt["BaseScheme"]], None]]:
+    
+    """Get ``f(value, scheme_ins)`` which calls every validator in order
+
+    None if there is no validator
+    """
+    if not validators:
+        return None
+    return _validators_template(len(validators))(*validators)
+
+
+@functools.lru_cache(maxsize=None)
+def _set_template(
+    has_name: bool, has_converter: bool, has_validate: bool, is_partial: bool
+) -> typing.Callable[..., typing.Callable]:
+    
+    """Compile (once per shape) a factory
+    ``make(_name, _get_default, _convert, _validate) -> set_(field, instance, value)``
+    for :meth:`Field.__set__`, keeping only the branches the shape needs
+
+    Values are stored like :meth:`BaseScheme._set_value`, but with
+    ``_name`` (in_scheme_name) bound in the closure
+    """
+    lines = [
+        "def make(_name, _get_default, _convert, _validate):",
+        "  def set_(field, instance, value):",
+        # unnamed yet, let the property raise
+        "    name = _name" if has_name else "    name = field.in_scheme_name",
+        "    field_values = instance.__field_values__",
+        "    initialized = name in field_values",
+        "    if value is _undefined:",
+        "        if initialized:",
+        "            return",
+    ]
+    if is_partial:
+        lines += [
+            "        field_values[name] = _undefined",
+            "        instance._mark_partial(name)",
+            "        return",
+        ]
+    else:
+        lines += [
+            "        if instance.__partial__:",
+            "            field_values[name] = _undefined",
+            "            instance._mark_partial(name)",
+            "            return",
+            "        value = _get_default()",
+        ]
+    if has_converter:
+        lines += [
+            "    else:",
+            "        value = _convert(value)",
+        ]
+    if has_validate:
+        lines.append("    _validate(value, instance)")
+    lines += [
+        "    if instance.__proxy__:",
+        "        value = field._proxy_value(value, instance)",
+        "    field_values[name] = value",
+        "    if initialized:",
+        "        instance.mark_dirty(field)",
+        "  return set_",
+    ]
+    namespace: typing.Dict[str, typing.Any] = {'_undefined': _undefined}
+    exec('\n'.join(lines) + '\n', namespace)
+    return namespace['make']
+
+
+def _compile_set(
+    name: Opt[str],
+    get_default: typing.Callable[[], typing.Any],
+    converter: Opt[BaseConverter],
+    validate: Opt[typing.Callable[[typing.Any, Opt["BaseScheme"]], None]],
+    is_partial: bool
+) -> typing.Callable[["Field", "BaseScheme", typing.Any], None]:
+    
+    """Get ``f(field, instance, value)`` for :meth:`Field.__set__`,
+    see :func:`_set_template`
+    """
+    return _set_template(
+        name is not None, converter is not None, validate is not None, is_partial
+    )(name, get_default, converter, validate)
+
+
+_IMMUTABLE_TYPES: typing.FrozenSet[type] = frozenset((
+    int, float, complex, bool, str, bytes, tuple, frozenset, types.NoneType,
+))
+"""Value types whose methods never modify the value in place"""
+
+
+_DUNDER_METHOD_BODIES: typing.Dict[str, typing.Tuple[str, str]] = {
+    **{
+        f'__{name}__': ('other', f'self._obj {op} other')
+        for name, op in (
+            ('add', '+'), ('sub', '-'), ('mul', '*'), ('truediv', '/'),
+            ('floordiv', '//'), ('mod', '%'),
+            ('eq', '=='), ('ne', '!='), ('lt', '<'), ('le', '<='),
+            ('gt', '>'), ('ge', '>='),
+            ('and', '&'), ('or', '|'), ('xor', '^'),
+            ('lshift', '<<'), ('rshift', '>>'),
+        )
+    },
+    **{
+        f'__{name}__': ('', f'{func}(self._obj)')
+        for name, func in (
+            ('len', 'len'), ('int', 'int'), ('float', 'float'),
+            ('str', 'str'), ('repr', 'repr'), ('hash', 'hash'),
+            ('iter', 'iter'), ('next', 'next'), ('reversed', 'reversed'),
+            ('abs', 'abs'),
+        )
+    },
+    '__pow__': ('other, mod=None', 'pow(self._obj, other, mod)'),
+    '__invert__': ('', '~self._obj'),
+    '__round__': ('ndigits=None', 'round(self._obj, ndigits)'),
+    '__getitem__': ('key', 'self._obj[key]'),
+    '__contains__': ('item', 'item in self._obj'),
+    '__call__': ('*args, **kwargs', 'self._obj(*args, **kwargs)'),
+}
+"""Special method name -> (parameters, returned expression) on ``self._obj``"""
+
+
+def _install_dunder_methods(cls):
+    """Install generated special methods of :data:`_DUNDER_METHOD_BODIES`
+    on the decorated proxy class
+
+    所有方法拼成一段源码，只编译一次；函数体直接作用于 ``self._obj``，
+    不经过 ``getattr``
+    """
+    source = "\n".join(
+        f"def {name}(self, {params}):\n    return {expr}\n"
+        for name, (params, expr) in _DUNDER_METHOD_BODIES.items()
+    )
+    namespace: typing.Dict[str, typing.Any] = {}
+    exec(compile(source, f"<{cls.__name__} special methods>", "exec"), namespace)
+    for name in _DUNDER_METHOD_BODIES:
+        setattr(cls, name, namespace[name])
+    return cls
+
+
 FieldValueTV = typing.TypeVar('FieldValueTV')
+@_install_dunder_methods
 class FieldValueProxy(typing.Generic[FieldValueTV]):
 
     '''
@@ -44,22 +234,31 @@ class FieldValueProxy(typing.Generic[FieldValueTV]):
     --------------
     透明代理
     ^^^^^^^^^^
-    - 在下方通过 for 循环注册了一堆特殊方法
+    - 通过 :func:`_install_dunder_methods` 注册了一堆特殊方法
     - `__bool__` 特殊处理
+    - 原始对象类型的公开方法预先定义在按类型缓存的子类上
+      （见 :meth:`_get_proxy_cls`），不经过 `__getattr__`
     ''' 
 
+    __slots__ = ('_obj', '_field', '_scheme')
+
+    __proxy_classes__: typing.ClassVar[typing.Dict[type, type]] = {}
+    """Original object type -> proxy subclass"""
+
     def __init__(self, 
         obj: FieldValueTV, 
-        modified: typing.Callable,
         field: "Field[FieldValueTV]",
         scheme: "BaseScheme"
     ) -> None:
 
         self._obj: FieldValueTV = obj
-        self._modified = modified
         self._field: "Field[FieldValueTV]" = field
         self._scheme: "BaseScheme" = scheme
 
+    def _modified(self) -> None:
+        """原始对象被修改，标记字段为脏字段"""
+        self._scheme.mark_dirty(self._field)
+
     @property
     def scheme(self): return self._scheme
     
@@ -75,27 +274,68 @@ class FieldValueProxy(typing.Generic[FieldValueTV]):
         return self._obj
 
     @staticmethod
-    def _get_obj_dunder_method_caller(name: str) -> typing.Callable:
+    def _get_obj_method_caller(
+        name: str, method: typing.Callable, mutable: bool = True
+    ) -> typing.Callable:
 
-        def dunder_method_caller(self: typing.Self, *args, **kwargs):
-            return getattr(self._obj, name)(*args, **kwargs)
+        if mutable:
+            def method_caller(self: typing.Self, *args, **kwargs):
+                res = method(self._obj, *args, **kwargs)
+                self._modified()  # 字段内部修改
+                return res
+        else:
+            # 不可变对象的方法不会修改字段值
+            def method_caller(self: typing.Self, *args, **kwargs):
+                return method(self._obj, *args, **kwargs)
+
+        method_caller.__name__ = method_caller.__qualname__ = name
+        return method_caller
+
+    @classmethod
+    def _get_proxy_cls(cls, tp: type) -> typing.Type["FieldValueProxy"]:
+
+        """获取代理该类型对象的子类
 
-        return dunder_method_caller
+        子类上定义了该类型所有公开的实例方法，结果按类型缓存
+        """
+        proxy_cls = cls.__proxy_classes__.get(tp)
+        if proxy_cls is not None:
+            return proxy_cls
+
+        namespace: typing.Dict[str, typing.Any] = {'__slots__': ()}
+        mutable = tp not in _IMMUTABLE_TYPES
+        for name in dir(tp):
+            if name.startswith('_') or hasattr(cls, name):
+                continue
+            method = inspect.getattr_static(tp, name)
+            # only plain instance methods, others go to __getattr__
+            if isinstance(method, (
+                types.FunctionType, types.MethodDescriptorType,
+                types.WrapperDescriptorType
+            )):
+                namespace[name] = cls._get_obj_method_caller(name, method, mutable)
+        
+        proxy_cls = type(f'{cls.__name__}[{tp.__name__}]', (cls,), namespace)
+        cls.__proxy_classes__[tp] = proxy_cls
+        return proxy_cls
 
     def __bool__(self):
+        return bool(self._obj)
 
-        try:
-            return getattr(self._obj, '__bool__')()
-        except AttributeError:
-            return bool(self._obj)
+    def __setitem__(self, key, value) -> None:
+        self._obj[key] = value
+        self._modified()  # 字段内部修改
+
+    def __delitem__(self, key) -> None:
+        del self._obj[key]
+        self._modified()
 
     def __getattr__(self, name: str) -> typing.Any:
         
         attr = getattr(self._obj, name)
         
-        # 代理方法
-        if callable(attr):
-            @functools.wraps(attr)
+        # 代理方法（不可变对象无需追踪修改）
+        if callable(attr) and type(self._obj) not in _IMMUTABLE_TYPES:
             def wrapper(*args, **kwargs):
                 res = attr(*args, **kwargs)
                 self._modified()  # 字段内部修改
@@ -107,10 +347,11 @@ class FieldValueProxy(typing.Generic[FieldValueTV]):
     
     def __setattr__(self, name: str, value: typing.Any) -> None:
         
-        if name in ('_obj', '_modified', '_field', '_scheme'):
-            super().__setattr__(name, value)
-        else:
+        try:  # own slots
+            object.__setattr__(self, name, value)
+        except AttributeError:
             setattr(self._obj, name, value)
+            self._modified()  # 字段内部修改
 
     @staticmethod
     def dump(value: FieldValueTV | "FieldValueProxy[FieldValueTV]") -> FieldValueTV:
@@ -119,20 +360,6 @@ class FieldValueProxy(typing.Generic[FieldValueTV]):
         return value
 
 
-for i in (
-    'add', 'sub', 'mul', 'truediv', 'floordiv', 'mod', 'pow',
-    'eq', 'ne', 'lt', 'le', 'gt', 'ge',
-    'len', 'getitem', 'setitem', 'contains',
-    'int', 'float', 'str', 'repr',
-    'hash', 'call', 'iter',
-    'next', 'reversed', 'abs', 'round',
-    'and', 'or', 'xor', 'invert',
-    'lshift', 'rshift'
-):
-    setattr(
-        FieldValueProxy, f'__{i}__', 
-        FieldValueProxy._get_obj_dunder_method_caller(f'__{i}__')
-    )
 
 @typing.runtime_checkable
 class FieldValueProtocol(typing.Protocol[FieldValueTV]):
@@ -157,6 +384,14 @@ class Field(typing.Generic[FieldValueTV]):
     See :doc:`/design/scheme/validator`
     """
 
+    __slots__ = (
+        '__name', '__in_scheme_name', '__hash', '__scheme_cls',
+        '__default', '__default_factory', '__get_default', '__vtype',
+        '__is_key', '__is_natural_key', '__is_foreign_key',
+        '__converter', '__validators', '__validate',
+        '__is_partial', '__dump_flags', '__dump_flag_mask', '__init', '__set',
+    )
+
     def __init__(
         self, 
         default: typing.Union[Undefined, FieldValueTV] = _undefined, 
@@ -171,7 +406,7 @@ class Field(typing.Generic[FieldValueTV]):
         converter: Opt[BaseConverter[FieldValueTV]] = None,
         validators: Opt[typing.Iterable["BaseValidator"]] = None,
         is_partial: bool = False,
-        dump_flags: Opt[set[str]] = None,
+        dump_flags: Opt[typing.AbstractSet[str]] = None,
         init: bool = True,
     ):
 
@@ -207,52 +442,91 @@ class Field(typing.Generic[FieldValueTV]):
         :param init: 
             see `Dataclass field specifier parameters <https://typing.python.org/en/latest/spec/dataclasses.html#field-specifier-parameters>`_
         """
-        self.__name = name
-        self.__in_scheme_name = in_scheme_name or name
+        # interned: names are used as keys of every instance's field values
+        self.__name = _intern(name)
+        self.__in_scheme_name = _intern(in_scheme_name or name)
+        self.__hash = hash(self.__in_scheme_name or self.__name)
         self.__scheme_cls = scheme_cls
         self.__default = default
         self.__default_factory = default_factory
+        # resolved once, default_value just calls it
+        if default_factory is not None:
+            self.__get_default = default_factory
+        elif default is not _undefined:
+            self.__get_default = lambda: default
+        else:
+            self.__get_default = self.__raise_no_default
         self.__vtype = vtype
         self.__is_key = is_key
         self.__is_natural_key = is_natural_key
         self.__is_foreign_key = is_foreign_key
         self.__converter: BaseConverter | None = converter
-        self.__validators: typing.List["BaseValidator"] = list(validators or [])
+        self.__validators: typing.Tuple["BaseValidator", ...] = tuple(validators or ())
+        # built lazily (on first use), after the scheme class is finalized
+        self.__validate = _undefined
         self.__is_partial = is_partial
-        self.__dump_flags = dump_flags or set()
+        # frozen: the mask below is computed from it once
+        self.__dump_flags = frozenset(dump_flags or ())
+        self.__dump_flag_mask = dump_flag_mask(self.__dump_flags)
         self.__init = init
+        self.__set = None
+
+    def __get_validate(self) -> Opt[typing.Callable[[typing.Any, Opt["BaseScheme"]], None]]:
+        """Validator chain, built on first use"""
+        validate = self.__validate
+        if validate is _undefined:
+            validate = self.__validate = _compile_validators(self.__validators)
+        return validate
+
+    def __build_set(self) -> typing.Callable[["Field", "BaseScheme", typing.Any], None]:
+        """Build the specialized ``__set__`` body on first set;
+        reset ``__set`` to None whenever what it binds changes
+        """
+        set_ = self.__set = _compile_set(
+            self.__in_scheme_name,
+            self.__get_default,
+            self.__converter,
+            self.__get_validate(),
+            self.__is_partial
+        )
+        return set_
         
     def fork(self, 
         default: Undefined | FieldValueTV = _undefined,
-        default_factory: Opt[typing.Callable[[], FieldValueTV]] = None,
+        default_factory: Undefined | Opt[typing.Callable[[], FieldValueTV]] = _undefined,
         vtype: Undefined | typing.Type[FieldValueTV] = _undefined,
-        name: Opt[str] = None,
-        in_scheme_name: Opt[str] = None,
-        scheme_cls: Opt[typing.Type["BaseScheme"]] = None,
-        is_key: bool = False,
-        is_natural_key: bool = True,
-        is_foreign_key: bool = False,
-        converter: Opt[BaseConverter[FieldValueTV]] = None,
+        name: Undefined | Opt[str] = _undefined,
+        in_scheme_name: Undefined | Opt[str] = _undefined,
+        scheme_cls: Undefined | Opt[typing.Type["BaseScheme"]] = _undefined,
+        is_key: Undefined | bool = _undefined,
+        is_natural_key: Undefined | bool = _undefined,
+        is_foreign_key: Undefined | bool = _undefined,
+        converter: Undefined | Opt[BaseConverter[FieldValueTV]] = _undefined,
         fork_validators: bool = True,
-        is_partial: Opt[bool] = None,
-        dump_flags: Opt[set[str]] = None,
-        init: Opt[bool] = None,
+        is_partial: Undefined | Opt[bool] = _undefined,
+        dump_flags: Undefined | Opt[typing.AbstractSet[str]] = _undefined,
+        init: Undefined | bool = _undefined,
     ) -> typing.Self:
+        """复制字段
+
+        未传入（``_undefined``）的参数沿用本字段的值；
+        传入的 ``None``、``False`` 等会原样生效
+        """
         try:
             return self.__class__(
                 default=default if default is not _undefined else self.__default,
-                default_factory=default_factory or self.__default_factory,
-                name=name or self.__name,
-                in_scheme_name=in_scheme_name or self.__in_scheme_name,
-                scheme_cls=scheme_cls or self.__scheme_cls,
-                is_key = is_key or self.__is_key,
-                is_natural_key = is_natural_key or self.__is_natural_key,
-                is_foreign_key=is_foreign_key or self.__is_foreign_key,
-                converter=converter or self.__converter,
+                default_factory=default_factory if default_factory is not _undefined else self.__default_factory,
+                name=name if name is not _undefined else self.__name,
+                in_scheme_name=in_scheme_name if in_scheme_name is not _undefined else self.__in_scheme_name,
+                scheme_cls=scheme_cls if scheme_cls is not _undefined else self.__scheme_cls,
+                is_key=is_key if is_key is not _undefined else self.__is_key,
+                is_natural_key=is_natural_key if is_natural_key is not _undefined else self.__is_natural_key,
+                is_foreign_key=is_foreign_key if is_foreign_key is not _undefined else self.__is_foreign_key,
+                converter=converter if converter is not _undefined else self.__converter,
                 validators=self.__validators if fork_validators else None,
-                is_partial=is_partial or self.__is_partial,
-                dump_flags=dump_flags or self.__dump_flags,
-                init=init or self.__init,
+                is_partial=is_partial if is_partial is not _undefined else self.__is_partial,
+                dump_flags=dump_flags if dump_flags is not _undefined else self.__dump_flags,
+                init=init if init is not _undefined else self.__init,
                 vtype=vtype if vtype is not _undefined else self.__vtype
             )
         except TypeError:
@@ -262,20 +536,30 @@ class Field(typing.Generic[FieldValueTV]):
     def __hash__(self) -> int:
         """哈希值
 
-        in_scheme_name or name
+        in_scheme_name or name; computed when names are set
         """
-        return hash(self.__in_scheme_name or self.__name)
+        return self.__hash
     
     def __eq__(self, value) -> bool:
 
         """Make BlueFirmamentField(name='name') == 'name'
         """
+        if value is self:
+            return True
         if isinstance(value, str):
             return self.__name == value or self.__in_scheme_name == value
         elif isinstance(value, Field):
-            # name, vtype
-            return self.__name == value.name and self.value_type == value.value_type
-        return False
+            # name, vtype; read slots directly so unnamed or
+            # converter-less fields compare instead of raising
+            if self.__name != value.__name:
+                return False
+            converter, other = self.__converter, value.__converter
+            if converter is other:
+                return True
+            if converter is None or other is None:
+                return False
+            return converter.type == other.type
+        return NotImplemented
 
     @property
     def name(self) -> str: 
@@ -303,7 +587,8 @@ class Field(typing.Generic[FieldValueTV]):
             if no_raise:
                 return None
             raise ValueError('Field name is immutable')
-        self.__name = value
+        self.__name = _intern(value)
+        self.__hash = hash(self.__in_scheme_name or self.__name)
 
     def _set_in_scheme_name(self, value: str, no_raise: bool = False) -> None:
         """设置字段在数据模型中的名称
@@ -314,7 +599,9 @@ class Field(typing.Generic[FieldValueTV]):
             if no_raise:
                 return None
             raise ValueError('Field in_scheme_name is immutable')
-        self.__in_scheme_name = value
+        self.__in_scheme_name = _intern(value)
+        self.__hash = hash(self.__in_scheme_name or self.__name)
+        self.__set = None
 
     @property
     def vtype(self) -> typing.Type[FieldValueTV]:
@@ -333,9 +620,14 @@ class Field(typing.Generic[FieldValueTV]):
         return self.__scheme_cls
     
     @property
-    def dump_flags(self) -> set[str]:
+    def dump_flags(self) -> frozenset[str]:
         return self.__dump_flags
 
+    @property
+    def dump_flag_mask(self) -> int:
+        """``dump_flags`` packed by :func:`dump_flag_mask`"""
+        return self.__dump_flag_mask
+
     def _set_scheme_cls(self, 
         scheme_cls: Opt[typing.Type["BaseScheme"]],
         no_raise: bool = False,
@@ -358,20 +650,23 @@ class Field(typing.Generic[FieldValueTV]):
 
     def _set_converter(self, 
         converter: BaseConverter[FieldValueTV],
-        safe: bool = True
+        safe: bool = True,
+        force: bool = False
     ) -> None:
 
         """
         :param converter:
+        :param force: Override converter even if set
 
         :raise ValueError: Conveter has been set
         """
-        if self.__converter is not None:
+        if self.__converter is not None and not force:
             if not safe:
                 raise ValueError('converter is immutable')
             else:
                 return
         self.__converter = converter
+        self.__set = None
 
     def _set_converter_from_anno(self, 
         annotation: typing.Type[FieldValueTV],
@@ -401,6 +696,7 @@ class Field(typing.Generic[FieldValueTV]):
                 annotation = annotation.__orig_bases__[0]  # type: ignore[attr-defined]
 
         self.__converter = get_converter_from_anno(annotation)
+        self.__set = None
 
     def _add_validator(self, validator: "BaseValidator") -> None:
 
@@ -409,8 +705,11 @@ class Field(typing.Generic[FieldValueTV]):
         :param validator: 校验器
 
         - 用户不应当调用
+        - 在数据模型类构建时调用，之后校验器不再变化
         """
-        self.__validators.append(validator)
+        self.__validators += (validator,)
+        self.__validate = _undefined
+        self.__set = None
 
     @property
     def value_type(self) -> typing.Type[FieldValueTV]:
@@ -456,12 +755,10 @@ class Field(typing.Generic[FieldValueTV]):
 
         :raise ValueError: If no default value provided.
         """
-        if self.__default_factory:
-            return self.__default_factory()
-        elif self.__default is not _undefined:
-            return self.__default
-        else:
-            raise ValueError('No default value provided for field %s' % self.in_scheme_name)
+        return self.__get_default()
+    
+    def __raise_no_default(self) -> typing.NoReturn:
+        raise ValueError('No default value provided for field %s' % self.in_scheme_name)
     
     def convert(self, value: typing.Any) -> FieldValueTV:
 
@@ -484,8 +781,9 @@ class Field(typing.Generic[FieldValueTV]):
 
         :raises ValueError: 如果值不合法
         """
-        for validator in self.__validators:
-            validator(value, scheme_ins=scheme_ins)
+        validate = self.__get_validate()
+        if validate is not None:
+            validate(value, scheme_ins)
         
     def equals(self, value: typing.Any) -> EqFilter:
         '''该字段等于该值的筛选器
@@ -531,43 +829,21 @@ class Field(typing.Generic[FieldValueTV]):
 
         if instance is None:
             return self
-        return typing.cast(FieldValueTV, instance._get_value(self))
+        # same as BaseScheme._get_value, without the property
+        return instance.__field_values__[self.__in_scheme_name]
         
     def __set__(self, instance: "BaseScheme", value: FieldValueTV) -> None:
 
         """
         .. versionchanged:: 0.1.2
             if initialized, set to undefined will change nothing
-        """
-
-        initialized = self.in_scheme_name in instance.__field_values__
-
-        # convert value
-        if value is _undefined:
-            if initialized:
-                return
-            if self.__is_partial or instance.__partial__:
-                instance._set_value(self, _undefined)
-                instance._mark_partial(self.in_scheme_name)
-                return
-            else:
-                value = self.default_value                        
-        else:
-            value = self.convert(value)
-
-        # validate value
-        self.validate(value, scheme_ins=instance)
-
-        if instance.__proxy__:
-            value_ = self._proxy_value(value, instance)
-        else:
-            value_ = value
         
-        instance._set_value(self, value_)  # save
-
-        # if already initialized, mark as dirty
-        if initialized:
-            instance.mark_dirty(self.in_scheme_name)
+        Body is generated per field shape, see :func:`_set_template`
+        """
+        set_ = self.__set
+        if set_ is None:
+            set_ = self.__build_set()
+        set_(self, instance, value)
 
     def _proxy_value(self, 
         value: FieldValueTV, instance: "BaseScheme"
@@ -575,11 +851,8 @@ class Field(typing.Generic[FieldValueTV]):
         
         if not isinstance(value, FieldValueProxy):
             # 避免循环代理
-            return FieldValueProxy(
-                value, 
-                lambda: instance.mark_dirty(self.in_scheme_name),
-                self,
-                instance
+            return FieldValueProxy._get_proxy_cls(type(value))(
+                value, self, instance
             )
         return value  # 已经是代理对象了
 
@@ -601,17 +874,18 @@ class Field(typing.Generic[FieldValueTV]):
         这个数据模型只包含本字段
         """
 
-        exec_namespace = {
-            "BaseScheme": BaseScheme,
-            "FieldIns": self,
-        }
-        exec_result = {}
-
-        class_sig = "class AnonymousScheme(BaseScheme):\n"
-        class_body = f"    {self.name} = FieldIns\n"
+        from .main import BaseScheme
 
-        exec(class_sig + class_body, exec_namespace, exec_result)
-        return exec_result["AnonymousScheme"]
+        # new_class resolves the metaclass like a class statement
+        # but skips parsing and compiling source
+        return types.new_class(
+            "AnonymousScheme", (BaseScheme,),
+            exec_body=lambda ns: ns.update({
+                '__module__': __name__,
+                '__qualname__': "AnonymousScheme",
+                self.name: self,
+            })
+        )
 
 
 T = typing.TypeVar('T')
@@ -625,10 +899,12 @@ def field(
     converter: Opt[BaseConverter] = None,
     validators: Opt[typing.Iterable['BaseValidator']] = None,
     is_partial: bool = False,
-    dump_flags: Opt[set[str]] = None,
+    dump_flags: Opt[typing.AbstractSet[str]] = None,
     init: bool = True
-):
-    return Field[T](
+) -> Field[T]:
+    # not Field[T](...): calling a generic alias costs an extra
+    # _GenericAlias.__call__ for every field declared
+    return Field(
         default=default, 
         default_factory=default_factory, 
         name=name, 
@@ -653,6 +929,8 @@ class PrivateField[FieldValueType](Field[FieldValueType]):
     - 不会被校验
     - 实例化时不是必须的
     """
+
+    __slots__ = ()
     
     @property
     def name(self): raise ValueError('Private field name is forbidden')
@@ -663,9 +941,9 @@ class PrivateField[FieldValueType](Field[FieldValueType]):
 def private_field(
     default: T | Undefined = _undefined,
     default_factory: Opt[typing.Callable[[], T]] = None,
-):
+) -> PrivateField[T]:
     
-    return PrivateField[T](
+    return PrivateField(
         default=default, 
         default_factory=default_factory, 
     )
@@ -680,6 +958,8 @@ class CompositeField(
 
     - Enable partial for composite field makes sub scheme partial.
     """
+
+    __slots__ = ()
     
     @property
     def name(self): 
@@ -20,7 +20,7 @@ from .._types import Undefined, _undefined
 from .validator import SchemeValidator, FieldValidator
 from .field import (
     CompositeField, PrivateField, Field, 
-    field, dump_field_name
+    field, dump_flag_mask
 )
 from .field import FieldValueProxy
 if typing.TYPE_CHECKING:
@@ -78,7 +78,7 @@ class SchemeMetaclass(abc.ABCMeta):
 
     数据模型实例化
     ^^^^^^^^^^^^^^^^
-    - 未传递的字段将使用默认值，没有默认值将变为BlueFirmamentUndefinedValue
+    - 未传递的字段将使用默认值，没有默认值将变为 ``_undefined``（全局唯一的 ``Undefined.token``）
 
     Behavior
     ---------
@@ -130,6 +130,9 @@ class SchemeMetaclass(abc.ABCMeta):
     __fields__: typing.Dict[str, Field]
     """Fields and their instances defined in the scheme
     """
+    __field_keys__: typing.FrozenSet[str]
+    """Keys (in scheme names) of ``__fields__``, for fast membership checks
+    """
     __private_fields__: typing.Dict[str, PrivateField]
     """Private fields and their instances defined in the scheme
     """
@@ -147,6 +150,9 @@ class SchemeMetaclass(abc.ABCMeta):
     """
     __default_edflags__: Opt[set[str]]
     __default_idflags__: Opt[set[str]]
+    __hydrate__: typing.Callable[..., "BaseScheme"]
+    """Generated ``(cls, row, **kwargs) -> instance``, see ``BaseScheme.from_row``
+    """
     __builtin_ivars__: typing.Dict[str, typing.Any] = {
         '__logger__': None,
         '__instantiated__': False,
@@ -219,14 +225,16 @@ class SchemeMetaclass(abc.ABCMeta):
         if default_include_dump_flags:
             attrs["__default_idflags__"] = default_include_dump_flags
         for builtin_f, default_v in cls.__builtin_cvars__.items():
-            if builtin_f not in attrs:
-                # Find in bases
-                for base in bases:
-                    if hasattr(base, builtin_f):
-                        attrs[builtin_f] = copy.copy(getattr(base, builtin_f))
-                        break
-                else:
-                    attrs[builtin_f] = default_v if not callable(default_v) else default_v()
+            if builtin_f in attrs:
+                continue
+            # Find in bases; one lookup per base instead of hasattr + getattr
+            for base in bases:
+                base_v = getattr(base, builtin_f, _undefined)
+                if base_v is not _undefined:
+                    attrs[builtin_f] = copy.copy(base_v)
+                    break
+            else:
+                attrs[builtin_f] = default_v if not callable(default_v) else default_v()
         
         # Resolve fields
         fields: typing.Dict[str, Field] = attrs['__fields__']
@@ -268,6 +276,10 @@ class SchemeMetaclass(abc.ABCMeta):
                 scheme_validators.append(v)
                 continue
 
+            # Field validators are attached to their field on creation
+            if isinstance(v, FieldValidator):
+                continue
+
 
             # Resolve private fields 
             if isinstance(v, PrivateField):
@@ -297,12 +309,6 @@ class SchemeMetaclass(abc.ABCMeta):
 
                 fields[k] = Field(v, name=k, in_scheme_name=k)
 
-        # Set up field converter from annotations
-        for k, field_ in (fields | private_fields).items():
-            anno = attrs.get('__annotations__', {}).get(k)
-            if anno:
-                field_._set_converter_from_anno(anno)
-
         # Resolve attrs having only annotation
         cls_annotations = attrs.get('__annotations__', {})
         for k, anno in cls_annotations.items():
@@ -314,23 +320,29 @@ class SchemeMetaclass(abc.ABCMeta):
                 # Field[ValueT]
                 orig = typing.get_origin(anno)
                 if safe_issubclass(orig, Field):
-                    field = orig(
+                    fields[k] = orig(
                         name=k, in_scheme_name=k, 
                         vtype=typing.get_args(anno)[0]
                     )
-                    field._set_converter_from_anno(anno)
-                    fields[k] = field
                     continue
 
                 # ValueT
                 # not yet resolved above
                 fields[k] = Field(name=k, in_scheme_name=k, vtype=anno)
-                fields[k]._set_converter_from_anno(anno)
 
+        # fields and private fields are final from here on
+        all_fields = fields | private_fields
 
-        # Replace attributes that recognized as fields' value to field instance
-        for k, default_v in (fields | private_fields).items():
-            attrs[k] = default_v
+        for k, field_ in all_fields.items():
+            # Set up field converter from annotations
+            anno = cls_annotations.get(k)
+            if anno:
+                field_._set_converter_from_anno(anno)
+
+            # Replace attributes that recognized as fields' value to field instance
+            attrs[k] = field_
+
+        attrs['__field_keys__'] = frozenset(fields)
 
         # Resolve key field
         for v in fields.values():
@@ -342,8 +354,13 @@ class SchemeMetaclass(abc.ABCMeta):
         # dynamically create __init__ method
         init_params: set[str] = set()
         init_assignments = []
-        new_globals = globals().copy()
-        for k, field_ins in (fields | private_fields).items():
+        # only names the generated methods refer to, instead of a copy of
+        # this module's globals per class
+        new_globals: typing.Dict[str, typing.Any] = {
+            '_undefined': _undefined,
+            'SchemeMetaclass': SchemeMetaclass,
+        }
+        for k, field_ins in all_fields.items():
             # skip init=False
             if not field_ins.init:
                 continue
@@ -377,7 +394,13 @@ class SchemeMetaclass(abc.ABCMeta):
         else:
             init_sig = "def __init__(self, **kwargs):\n"
         init_body = '\n'
-        init_body += '    SchemeMetaclass.init_ivars(self)\n'
+        # inline SchemeMetaclass.init_ivars
+        for k, default_v in cls.__builtin_ivars__.items():
+            if callable(default_v):
+                new_globals[f'_ivar_factory{k}'] = default_v
+                init_body += f'    self.{k} = _ivar_factory{k}()\n'
+            else:
+                init_body += f'    self.{k} = {default_v!r}\n'
         init_body += '\n'.join(init_assignments)
         init_body += '\n    SchemeMetaclass.run_scheme_validators(self)\n'
         init_body += '    self.__post_init__()\n'
@@ -387,8 +410,21 @@ class SchemeMetaclass(abc.ABCMeta):
         init_body += '        self._logger.info("Scheme instantiated", scheme_data=self.dump_to_dict())\n'
 
         init_method = init_sig + init_body
-        
-        exec(init_method, new_globals, attrs)
+
+        # dynamically create __hydrate__ (row -> instance), unrolled over
+        # init params so that rows need not be unpacked as a whole
+        hydrate_method = "def __hydrate__(cls, row, **kwargs):\n"
+        hydrate_method += "    get = row.get\n"
+        hydrate_method += f"    return cls({''.join(
+            f'{i}=get({i!r}, _undefined), ' for i in init_params
+        )}**kwargs)\n"
+
+        # compile both in one go
+        exec(
+            compile(init_method + '\n' + hydrate_method, f"<{name} scheme>", "exec"),
+            new_globals, attrs
+        )
+        attrs['__hydrate__'] = staticmethod(attrs['__hydrate__'])
 
         result_class = super().__new__(cls, name, bases, attrs, **kwargs)
 
@@ -429,9 +465,15 @@ class SchemeMetaclass(abc.ABCMeta):
 
     @staticmethod
     def run_after_field_validators(ins: "BaseScheme"):
-        for _ in range(len(ins.__after_field_validators__)):
-            validator = ins.__after_field_validators__.pop(0)
-            validator(value=ins[validator._field], scheme_ins=ins)
+        avfs = ins.__after_field_validators__
+        ran = 0
+        try:
+            for validator in avfs:
+                ran += 1
+                validator(value=ins[validator._field], scheme_ins=ins)
+        finally:
+            # drop ran (including the failed) ones in one go
+            del avfs[:ran]
 
 
 TV = typing.TypeVar("TV")
@@ -474,6 +516,13 @@ class BaseScheme(metaclass=SchemeMetaclass):
     def __post_init__(self) -> None:
         """数据模型实例化后执行的操作；可以被重写"""
 
+    @staticmethod
+    def __hydrate__(cls, row, **kwargs):
+        """Fallback for classes the metaclass didn't generate one for
+        (``BaseScheme`` itself): pass the whole row to ``__init__``
+        """
+        return cls(**{**row, **kwargs})
+
     @staticmethod
     def _init_private_fields(obj: 'BaseScheme', data: typing.Any):
 
@@ -483,6 +532,18 @@ class BaseScheme(metaclass=SchemeMetaclass):
             else:
                 setattr(obj, k, v.default_value)
 
+    @classmethod
+    def from_row(cls, row: typing.Mapping[str, typing.Any], /, **kwargs) -> typing.Self:
+
+        """从数据行（如数据访问层返回的记录）实例化本数据模型
+
+        使用元类生成的 ``__hydrate__``，只读取字段对应的列，忽略其他列；
+        没有生成的（``BaseScheme`` 本身）则把整行传给 ``__init__``。
+
+        :param kwargs: 额外参数，同 ``__init__``
+        """
+        return cls.__hydrate__(cls, row, **kwargs)
+
     @classmethod
     def from_parents(cls, /, *parents: "BaseScheme") -> typing.Self:
 
@@ -614,18 +675,11 @@ class BaseScheme(metaclass=SchemeMetaclass):
         - 调用每个字段的校验器来序列化字段值
         """
         data = dict()
-        field_names: typing.Set[str] = set()
-
-        if only_dirty:
-            field_names = self.__dirty_fields__
-        else:
-            field_names = set(self.__fields__.keys())
-
-        if exclude_key:
-            field_names = field_names - {self.get_key_field().in_scheme_name}
-
-        if exclude_unset is True or (exclude_unset is None and self.__partial__):
-            field_names = field_names - self.__unset_fields__
+        dirty_fields = self.__dirty_fields__ if only_dirty else None
+        key_name = self.get_key_field().in_scheme_name if exclude_key else None
+        unset_fields = self.__unset_fields__ if (
+            exclude_unset is True or (exclude_unset is None and self.__partial__)
+        ) else None
 
         if exclude_flags is None and self.__default_edflags__:
             exclude_flags = self.__default_edflags__
@@ -633,16 +687,22 @@ class BaseScheme(metaclass=SchemeMetaclass):
         if include_flags is None and self.__default_idflags__:
             include_flags = self.__default_idflags__
 
-        for k in field_names:
-            field: Field = self.__fields__[k]
-
-            if exclude_flags:
-                if field.dump_flags.issuperset(exclude_flags):
-                    continue
+        # flags checks as int masks, see ``dump_flag_mask``
+        exclude_mask = dump_flag_mask(exclude_flags) if exclude_flags else 0
+        include_mask = dump_flag_mask(include_flags) \
+            if include_flags and not exclude_flags else 0
 
-            if include_flags and not exclude_flags:
-                if not field.dump_flags.issuperset(include_flags):
-                    continue
+        for k, field in self.__fields__.items():
+            if dirty_fields is not None and k not in dirty_fields:
+                continue
+            if k == key_name:
+                continue
+            if unset_fields is not None and k in unset_fields:
+                continue
+            if exclude_mask and (field.dump_flag_mask & exclude_mask) == exclude_mask:
+                continue
+            if include_mask and (field.dump_flag_mask & include_mask) != include_mask:
+                continue
                 
             field_v = FieldValueProxy.dump(getattr(self, k))
             if jsonable:
@@ -655,14 +715,30 @@ class BaseScheme(metaclass=SchemeMetaclass):
         
         return data
     
+    @staticmethod
+    def _resolve_field_key(key: typing.Any) -> Opt[str]:
+        """字段名/字段 -> 字段在数据模型中的名称；其他键返回 None
+        """
+        if isinstance(key, str):
+            return key
+        if isinstance(key, Field):
+            try:
+                return key.in_scheme_name
+            except ValueError:  # unnamed field
+                return None
+        return None
+
     def __getitem__(self, key: str | Field) -> typing.Any:
         
         """通过字段名/字段获取字段值
 
         Note: 不可以是其他属性，只可以是字段
+
+        :raise KeyError: 不是本数据模型的字段（包括非字段名/字段的键）
         """
-        if key in self.__fields__:
-            return getattr(self, dump_field_name(key, in_scheme=True))
+        name = self._resolve_field_key(key)
+        if name in self.__field_keys__:
+            return getattr(self, name)
         
         raise KeyError(f'{key} is not a field of {self.__class__.__name__}')
     
@@ -671,9 +747,13 @@ class BaseScheme(metaclass=SchemeMetaclass):
         """通过字段/字段名设置字段值
 
         Note: 不可以是其他属性，只可以是字段
+
+        :raise KeyError: 不是本数据模型的字段（包括非字段名/字段的键）
         """
-        field = self.__getitem__(key)
-        field.__set__(self, value)
+        name = self._resolve_field_key(key)
+        if name not in self.__field_keys__:
+            raise KeyError(f'{key} is not a field of {self.__class__.__name__}')
+        self.__fields__[name].__set__(self, value)
 
     @classmethod
     def keys(cls) -> typing.Iterable[str]:
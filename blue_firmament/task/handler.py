@@ -1,6 +1,7 @@
 """Task handler module.
 """
 
+import enum
 import inspect
 import typing
 from typing import Optional as Opt
@@ -19,6 +20,15 @@ if typing.TYPE_CHECKING:
     from ..manager import BaseManager
 
 
+class _ContextMark(enum.Enum):
+
+    """Handler kwarg resolved straight from task context
+    (instead of calling a getter)
+    """
+    TASK = 'task'
+    TASK_RESULT = 'task_result'
+
+
 class TaskHandler:
     """BlueFirmament TaskHandler
 
@@ -28,8 +38,11 @@ class TaskHandler:
 
     type HandlerKwargsT = typing.Dict[
         str,
-        typing.Callable[
-            ["BaseTaskContext", PathParamsT], typing.Coroutine,
+        typing.Union[
+            typing.Callable[
+                ["BaseTaskContext", PathParamsT], typing.Coroutine,
+            ],
+            _ContextMark,
         ]
     ]
     """Inner handler parameters"""
@@ -38,6 +51,11 @@ class TaskHandler:
         typing.Callable[..., typing.Awaitable[typing.Any]]
     ]
 
+    __slots__ = (
+        '__inner_handler', '__method_manager_cls',
+        '__handler_kwargs', '__handler_kwargs_items',
+    )
+
     def __init__(self,
         inner_handler: InnerHandlerT,
         manager_cls: Opt[typing.Type["BaseManager"]] = None,
@@ -55,6 +73,8 @@ class TaskHandler:
         # parse handler kwargs
         self.__handler_kwargs: TaskHandler.HandlerKwargsT =\
             self._parse_handler_kwargs(self.__inner_handler)
+        self.__handler_kwargs_items = tuple(self.__handler_kwargs.items())
+        """Frozen items of handler kwargs, iterated on every call"""
 
     def set_manager_cls(self, manager_cls: typing.Type["BaseManager"]):
         """Set inner handler's manager class if it's a manager method.
@@ -110,6 +130,7 @@ class TaskHandler:
         返回一个字典，键为处理器的参数名称，值为该参数的获取器。
 
         参数获取器接收 :class:`blue_firmament.transport.context.RequestContext` 作为参数，从中解析出本参数需要的值。
+        `Task`, `TaskResult` 不使用获取器，而是标记为 :class:`_ContextMark`，调用时直接从任务上下文中取出。
         """
         handler_params_sig = inspect.signature(handler).parameters
         kwargs: TaskHandler.HandlerKwargsT = {}
@@ -122,10 +143,10 @@ class TaskHandler:
             converter = get_converter_from_anno(param_sig.annotation)
 
             if safe_issubclass(anno, Task):
-                kwargs[name] = lambda tc, _: tc._task
+                kwargs[name] = _ContextMark.TASK
                 continue
             elif safe_issubclass(anno, TaskResult):
-                kwargs[name] = lambda tc, _: tc._task_result
+                kwargs[name] = _ContextMark.TASK_RESULT
                 continue
 
             kwargs[name] = cls.get_param_getter(name, converter)
@@ -146,10 +167,14 @@ class TaskHandler:
         - 自动处理返回值：处理器的返回值会被解析到响应对象中
         """
         # get kwargs
-        kwargs = {
-            name: await getter(task_context, path_params)
-            for name, getter in self.__handler_kwargs.items()
-        }
+        kwargs = {}
+        for name, getter in self.__handler_kwargs_items:
+            if getter is _ContextMark.TASK:
+                kwargs[name] = task_context._task
+            elif getter is _ContextMark.TASK_RESULT:
+                kwargs[name] = task_context._task_result
+            else:
+                kwargs[name] = await getter(task_context, path_params)
 
         # get args
         args = []
@@ -50,6 +50,11 @@ class TaskID:
         Contains all parameters' converters.
     """
 
+    __slots__ = (
+        '__method', '__path', '__segments',
+        '__dynamic_indices', '__param_converters',
+    )
+
     def __init__(
         self,
         method: Opt[Method],
@@ -147,11 +152,11 @@ class TaskID:
         """
         if my_segment_index in self.__dynamic_indices:  # dynamic segment
             param_name = self.segments[my_segment_index]
+            param_converter = self.__param_converters.get(param_name)
+            if param_converter is None:
+                raise ValueError(f"No converter for parameter: {param_name}")
             try:
-                param_converter = self.__param_converters[param_name]
                 return param_converter(to_match_segment)
-            except KeyError:
-                raise ValueError(f"No converter for parameter: {param_name}")
             except ValueError:
                 return _undefined
         else:  # static segment
@@ -206,16 +211,18 @@ class TaskID:
         - 如果参数校验不通过或不存在，则为 _undefined
         """
         result = {}
+        segments_len = len(segments)
 
         for i in self.__dynamic_indices:
             param_name = self.__segments[i]
+            param_converter = self.__param_converters.get(param_name)
+            # 我方不存在对应的分段，或没有对应的参数校验器
+            if i >= segments_len or param_converter is None:
+                result[param_name] = _undefined
+                continue
             try:
-                param_converter = self.__param_converters[param_name]
                 result[param_name] = param_converter(segments[i])
-            except (IndexError, KeyError, ValueError):
-                # IndexError: 我方不存在对应的分段
-                # KeyError: 没有对应的参数校验器
-                # ValueError: 校验不通过
+            except ValueError:  # 校验不通过
                 result[param_name] = _undefined
 
         return result
@@ -241,7 +248,7 @@ class TaskID:
 
         Tests
         ^^^^^
-        - `test_routing.TestRouteKey.test_is_match`
+        - `test_task.test_id.TestTaskID.test_is_match`
         """
         if not isinstance(task_id, TaskID):
             return None
@@ -253,20 +260,21 @@ class TaskID:
         if len(self.segments) != len(task_id.segments):
             return None
 
-        if not len(self.__dynamic_indices) == 0:
+        if len(self.__dynamic_indices) == 0:
             # no dynamic segments, so we can compare segments directly
             return {} if self.segments == task_id.segments else None
 
-        params = {}
-        for i in range(len(task_id.segments)):
-            seg_match = self.__is_segment_match(task_id.segments[i], i)
-            if seg_match[0] is False:
+        params = None  # allocated on first captured parameter
+        for i, segment in enumerate(task_id.segments):
+            seg_match = self.__is_segment_match(segment, i)
+            if seg_match is _undefined:
                 return None
-            else:
-                if seg_match[1] is not None:
-                    params[self.segments[i]] = seg_match[1]
+            if seg_match is not None:
+                if params is None:
+                    params = {}
+                params[self.segments[i]] = seg_match
 
-        return params
+        return {} if params is None else params
 
 
 @dataclasses.dataclass
@@ -8,10 +8,12 @@ __all__ = [
 ]
 
 import asyncio
+import collections
 import copy
 import typing
 from typing import Optional as Opt, Annotated as Anno, Literal as Lit
 
+from .._types import PathParamsT
 from .result import Body, JsonBody
 from ..task.context import BaseTaskContext
 from ..core.middleware import BaseMiddleware
@@ -35,6 +37,8 @@ class TaskEntry(BaseMiddleware):
         Will be set on copy of this entry, not the original one.
     """
 
+    __slots__ = ('__task_id', '__handlers', 'path_params')
+
     def __init__(self,
         task_id: TaskID,
         *handlers: TaskHandler
@@ -43,6 +47,10 @@ class TaskEntry(BaseMiddleware):
         self.__handlers: typing.List[TaskHandler] = list(*handlers)
         self.path_params: dict[str, str] = {}
 
+    @property
+    def task_id(self) -> TaskID:
+        return self.__task_id
+
     @property
     def handlers(self):
         return self.__handlers
@@ -123,7 +131,8 @@ class TaskRegistry:
 
     def __init__(self, 
         name: str = 'router',
-        path_prefix: str = ''
+        path_prefix: str = '',
+        lookup_cache_size: int = 0,
     ):
         """
         :param path_prefix: 
@@ -132,22 +141,39 @@ class TaskRegistry:
 
             Can be ``/abc/{var}`` or ``abc/{var}``, but don't
             end with a slash.
+        :param lookup_cache_size:
+            Max number of dynamic entry lookup results to remember
+            (least recently used evicted first), 0 disables it.
+
+            Lookup in dynamic entries is a linear scan converting path
+            parameters on every entry, enable this when the same
+            TaskIDs are looked up repeatedly under load.
+        """
+        self.__static_entries: dict[TaskID, TaskEntry] = {}
+        """Static entries keyed by their TaskID
+
+        First registered entry of a TaskID wins (as a set would keep).
         """
-        self.__static_entries: set[TaskEntry] = set()
         self.__dynamic_entries: list[TaskEntry] = list()
         self.__path_prefix = path_prefix
         self.__name = name
+        self.__lookup_cache_size = lookup_cache_size
+        self.__lookup_cache: collections.OrderedDict[
+            tuple[Opt[Method], str], tuple[TaskEntry, PathParamsT]
+        ] = collections.OrderedDict()
 
     @property
     def name(self): return self.__name
     @property
-    def static_entries(self): return self.__static_entries
+    def static_entries(self) -> set[TaskEntry]:
+        return set(self.__static_entries.values())
     @property
     def dynamic_entries(self): return self.__dynamic_entries
 
     def add_entry(self, entry: TaskEntry):
+        self.__lookup_cache.clear()
         if not entry.is_dynamic():
-            self.__static_entries.add(entry)
+            self.__static_entries.setdefault(entry.task_id, entry)
         else:
             self.__dynamic_entries.append(entry)
         
@@ -201,8 +227,9 @@ class TaskRegistry:
             # no such entry, create one
             entry = TaskEntry(task_id, handler)
 
+        self.__lookup_cache.clear()
         if not task_id.is_dynamic():
-            self.__static_entries.add(entry)
+            self.__static_entries.setdefault(entry.task_id, entry)
         else:
             self.__dynamic_entries.append(entry)
 
@@ -212,8 +239,10 @@ class TaskRegistry:
         Every entry to be merged will be prefixed with the path_prefix.
         (Of course on the forked entry)
         """
+        self.__lookup_cache.clear()
         for entry in to_merge.static_entries:
-            self.__static_entries.add(entry.fork(self.__path_prefix))
+            forked = entry.fork(self.__path_prefix)
+            self.__static_entries.setdefault(forked.task_id, forked)
         for entry in to_merge.dynamic_entries:
             self.__dynamic_entries.append(entry.fork(self.__path_prefix))
 
@@ -229,22 +258,38 @@ class TaskRegistry:
         if task_id.is_dynamic():
             raise TypeError("Cannot lookup a dynamic task_id")
 
-        intersection = self.__static_entries.intersection({task_id})
-        if intersection:
-            return intersection.pop()
+        static_entry = self.__static_entries.get(task_id)
+        if static_entry is not None:
+            return static_entry
         else:
             # lookup in dynamic entries
+            cache_key = (task_id.method, task_id.path)
+            cached = self.__lookup_cache.get(cache_key)
+            if cached is not None:
+                self.__lookup_cache.move_to_end(cache_key)
+                return self.__fork_matched(*cached)
+
             for entry in self.__dynamic_entries:
                 match_res = entry.is_match(task_id)
                 if match_res is not None:
-                    entry = copy.copy(entry)
-                    entry.path_params = match_res
-                    return entry
+                    if self.__lookup_cache_size:
+                        self.__lookup_cache[cache_key] = (entry, match_res)
+                        if len(self.__lookup_cache) > self.__lookup_cache_size:
+                            self.__lookup_cache.popitem(last=False)
+                    return self.__fork_matched(entry, match_res)
                 else:
                     continue
 
         raise KeyError(f"TaskID {task_id} don't has an entry in registry {self.name}")
 
+    @staticmethod
+    def __fork_matched(entry: TaskEntry, path_params: PathParamsT) -> TaskEntry:
+        """Copy a matched dynamic entry with path_params set.
+        """
+        entry = copy.copy(entry)
+        entry.path_params = dict(path_params)
+        return entry
+
 
 CallableTV = typing.TypeVar("CallableTV", bound=typing.Callable)
 def task(
@@ -14,7 +14,8 @@ def singleton(cls):
     
     """
     A decorator to implement a global single instance for a class.
-    This decorator uses a lock to ensure thread-safe instantiation.
+    This decorator uses a lock to ensure thread-safe instantiation,
+    the lock is only taken before the instance is created.
     """
     _instances = {}  # Store instances of decorated classes
     _lock = threading.Lock()
@@ -23,6 +24,10 @@ def singleton(cls):
         """
         Retrieves or creates the singleton instance.
         """
+        instance = _instances.get(cls)
+        if instance is not None:  # fast path, already created
+            return instance
+
         with _lock:  # Ensure thread-safe instantiation
             if cls not in _instances:
                 _instances[cls] = cls(*args, **kwargs)
@@ -99,9 +104,9 @@ def unwrap_callable(callbale: typing.Callable):
     if hasattr(callbale, '__call__') and not (
         inspect.isfunction(callbale) or inspect.ismethod(callbale)
     ):
-        return callable.__call__  # type: ignore[assignment]
+        return callbale.__call__
     
-    return callable
+    return callbale
 
 async def call_as_async(
     func: typing.Callable, *args, **kwargs
@@ -0,0 +1,62 @@
+"""Tests for core.middleware
+"""
+
+from blue_firmament.core.middleware import BaseMiddleware
+
+
+class AsyncRecorder(BaseMiddleware):
+
+    def __init__(self, name: str, calls: list) -> None:
+        self.name = name
+        self.calls = calls
+
+    async def __call__(self, *, next, task_context):
+        self.calls.append(f"{self.name} in")
+        await next()
+        self.calls.append(f"{self.name} out")
+
+
+class SyncRecorder(BaseMiddleware):
+
+    def __init__(self, name: str, calls: list) -> None:
+        self.name = name
+        self.calls = calls
+
+    def __call__(self, *, next, task_context):
+        self.calls.append(self.name)
+        return next()
+
+
+class Stopper(BaseMiddleware):
+
+    def __init__(self, calls: list) -> None:
+        self.calls = calls
+
+    def __call__(self, *, next, task_context):
+        self.calls.append("stop")
+
+
+async def test_run_middlewares():
+    """
+    - in order, async ones wrap the rest
+    - sync middleware continues by returning ``next()``
+    - not calling ``next`` stops the chain
+    """
+    calls = []
+    await BaseMiddleware.run_middlewares([
+        AsyncRecorder("a", calls),
+        SyncRecorder("b", calls),
+        AsyncRecorder("c", calls),
+        SyncRecorder("d", calls),
+    ], task_context=None)
+    assert calls == ["a in", "b", "c in", "d", "c out", "a out"]
+
+    calls = []
+    await BaseMiddleware.run_middlewares([
+        SyncRecorder("a", calls),
+        Stopper(calls),
+        SyncRecorder("b", calls),
+    ], task_context=None)
+    assert calls == ["a", "stop"]
+
+    await BaseMiddleware.run_middlewares([], task_context=None)
@@ -0,0 +1,28 @@
+"""Tests for scheme.business
+"""
+
+from blue_firmament.scheme.business import BusinessScheme
+
+
+class IntKeyed(BusinessScheme[int], key_type=int, disable_log=True):
+    name: str = ''
+
+
+class StrKeyed(BusinessScheme[str], key_type=str, disable_log=True):
+    pass
+
+
+def test_key_type():
+    """``key_type`` sets ``_id`` converter of the subclass only
+    """
+    assert IntKeyed(_id='3')._id == 3
+    assert IntKeyed(_id=3, name='n').name == 'n'
+    assert StrKeyed(_id=3)._id == '3'
+    assert IntKeyed.get_key_field().in_scheme_name == '_id'
+
+
+def test_inserted():
+    assert IntKeyed(_id=1)._inserted
+    assert not IntKeyed(_id=0)._inserted
+    assert StrKeyed(_id='a')._inserted
+    assert not StrKeyed(_id='')._inserted
@@ -0,0 +1,63 @@
+"""Tests for scheme.converter
+"""
+
+import typing
+import pytest
+from blue_firmament.scheme.main import BaseScheme
+from blue_firmament.scheme.converter import (
+    ListConverter, SetConverter, DictConverter,
+    IntConverter, UnionConverter,
+    get_converter_from_anno,
+)
+
+
+def test_container_modes():
+    """Container converters coerce other iterables in base mode,
+    reject them in strict mode
+    """
+    assert ListConverter(int)((1, '2')) == [1, 2]
+    assert ListConverter(int, mode='strict')([1, 2]) == [1, 2]
+    with pytest.raises(ValueError):
+        ListConverter(int, mode='strict')((1, 2))
+
+    assert SetConverter(int)([1, '2', 2]) == {1, 2}
+    assert SetConverter(int, mode='strict')({1, 2}) == {1, 2}
+    with pytest.raises(ValueError):
+        SetConverter(int, mode='strict')([1, 2])
+
+    assert DictConverter(int)([('a', '1')]) == {'a': 1}
+    assert DictConverter(int, mode='strict')({'a': 1}) == {'a': 1}
+    with pytest.raises(ValueError):
+        DictConverter(int, mode='strict')([('a', 1)])
+
+
+def test_dict_value_type():
+    """``Dict[K, V]`` converts values by V, keys are left as is
+    """
+    converter = get_converter_from_anno(typing.Dict[str, int])
+    assert converter({'a': '1', 'b': 2}) == {'a': 1, 'b': 2}
+    assert get_converter_from_anno(dict[str, int])({'a': '3'}) == {'a': 3}
+    assert get_converter_from_anno(dict[int, str])({1: 'x'}) == {1: 'x'}
+
+
+def test_shared_converter_isolation():
+    """Converters from annotations are shared, but changing one
+    field's converter or a composed converter's mode never leaks
+    """
+    shared = get_converter_from_anno(int)
+    UnionConverter(int, str)
+    ListConverter(int, mode='strict')
+    assert shared.mode == 'base'
+    assert get_converter_from_anno(int) is shared
+
+    class A(BaseScheme, disable_log=True):
+        a: typing.Optional[int] = None
+
+    class B(BaseScheme, disable_log=True):
+        b: typing.Optional[int] = None
+
+    A.__fields__['a']._set_converter(IntConverter(ge=0), force=True)
+    assert B(b='-1').b == -1
+    with pytest.raises(ValueError):
+        A(a=-1)
+    assert get_converter_from_anno(typing.Optional[int])(None) is None
@@ -0,0 +1,27 @@
+"""Tests for scheme.enum
+"""
+
+import pytest
+from blue_firmament.exceptions import InvalidStatusTransition
+from blue_firmament.scheme.enum import Status, transition
+
+
+class OrderStatus(Status):
+    OPEN = "open"
+    PAID = "paid"
+    CANCELLED = "cancelled"
+
+OrderStatus.to_cancelled = transition(OrderStatus.CANCELLED, OrderStatus.OPEN)  # type: ignore[attr-defined]
+
+
+def test_transition():
+    """
+    - allowed source goes to target
+    - already at target is idempotent
+    - other sources raise InvalidStatusTransition
+    """
+    assert OrderStatus.OPEN.to_cancelled() is OrderStatus.CANCELLED
+    assert OrderStatus.CANCELLED.to_cancelled() is OrderStatus.CANCELLED
+    with pytest.raises(InvalidStatusTransition):
+        OrderStatus.PAID.to_cancelled()
+    assert OrderStatus.to_cancelled.__name__ == 'to_cancelled'
@@ -2,7 +2,10 @@
 """
 
 
-from blue_firmament.scheme.field import field
+import types
+import pytest
+from blue_firmament.scheme.main import BaseScheme
+from blue_firmament.scheme.field import field, FieldValueProxy, _set_template
 
 
 def test_dump_flags():
@@ -14,3 +17,86 @@ def test_dump_flags():
     f2 = f.fork(dump_flags={"flag_c",})
     assert f2.dump_flags == {"flag_c",}
     
+
+
+def test_set_compiled_per_shape():
+    """``Field.__set__`` bodies are compiled lazily and shared by shape
+    """
+    class A(BaseScheme, disable_log=True):
+        a: int = 1
+        b: int = 2
+
+    assert A(a=3).a == 3
+    misses = _set_template.cache_info().misses
+
+    class B(A, disable_log=True):
+        c: int = 3
+
+    # class creation compiles nothing
+    assert _set_template.cache_info().misses == misses
+    b = B(a=4, c=5)
+    assert (b.a, b.b, b.c) == (4, 2, 5)
+    # same shape as A's fields, template reused
+    assert _set_template.cache_info().misses == misses
+
+
+def test_proxy_marks_dirty():
+    """In-place modification through proxies marks the field dirty,
+    reading (immutable values included) does not
+    """
+    class P(BaseScheme, proxy=True, disable_log=True):
+        items: list = field(default_factory=list)
+        mapping: dict = field(default_factory=dict)
+        ns: types.SimpleNamespace = field(
+            default_factory=lambda: types.SimpleNamespace(x=1)
+        )
+        name: str = 'n'
+        count: int = 0
+
+    p = P(mapping={'a': 1})
+    assert p.__dirty_fields__ == set()
+    # proxy is built as (obj, field, scheme)
+    assert p.items.field is P.__fields__['items']
+    assert p.items.scheme is p
+
+    # immutable values are proxied but never mark dirty
+    assert isinstance(p.name, FieldValueProxy)
+    assert p.name.upper() == 'N'
+    assert p.count + 1 == 1
+    assert p.__dirty_fields__ == set()
+
+    p.items.append(1)
+    assert p.__dirty_fields__ == {'items'}
+    p.items[0] = 2
+    assert p.items.obj == [2]
+
+    p.__dirty_fields__.clear()
+    p.mapping['b'] = 2
+    assert p.__dirty_fields__ == {'mapping'}
+    p.__dirty_fields__.clear()
+    del p.mapping['a']
+    assert p.__dirty_fields__ == {'mapping'}
+    assert p.mapping.obj == {'b': 2}
+
+    p.__dirty_fields__.clear()
+    p.ns.x = 2
+    assert p.__dirty_fields__ == {'ns'}
+    assert p.ns.obj.x == 2
+
+
+def test_fork_defaults():
+    """Omitted arguments are inherited, given ones (``None`` included) override
+    """
+    f = field(1, name='a')
+    assert f.fork().default_value == 1
+    assert f.fork().name == 'a'
+    assert f.fork(default=2).default_value == 2
+    assert f.fork(default=None).default_value is None
+
+    g = field(default_factory=list)
+    forked = g.fork()
+    assert forked.default_value == [] and forked.default_value is not g.default_value
+    assert g.fork(default_factory=dict).default_value == {}
+    with pytest.raises(ValueError):
+        # no factory, no default
+        g.fork(default_factory=None).default_value
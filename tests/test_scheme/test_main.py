@@ -2,6 +2,7 @@
 """
 
 import datetime
+import pytest
 from blue_firmament.scheme.main import BaseScheme
 from blue_firmament.scheme import field, FieldT
 
@@ -74,3 +75,56 @@ def test_dump_flags():
     }
 
     
+
+
+class Flagged(BaseScheme, disable_log=True):
+    a: int = field(1, dump_flags={"x", "y"})
+    b: int = field(2, dump_flags={"x"})
+    c: int = 3
+
+
+def test_dump_flags_filtering():
+    """exclude_flags drops fields having all of them,
+    include_flags keeps only fields having all of them (ignored with exclude_flags)
+    """
+    f = Flagged()
+    assert f.dump_to_dict() == {"a": 1, "b": 2, "c": 3}
+    assert f.dump_to_dict(exclude_flags={"x", "y"}) == {"b": 2, "c": 3}
+    assert f.dump_to_dict(exclude_flags={"x"}) == {"c": 3}
+    assert f.dump_to_dict(exclude_flags={"unknown"}) == {"a": 1, "b": 2, "c": 3}
+    assert f.dump_to_dict(include_flags={"x"}) == {"a": 1, "b": 2}
+    assert f.dump_to_dict(include_flags={"x", "y"}) == {"a": 1}
+    assert f.dump_to_dict(include_flags={"unknown"}) == {}
+    assert f.dump_to_dict(exclude_flags={"y"}, include_flags={"y"}) == {"b": 2, "c": 3}
+
+    # frozen, so the precomputed mask can't go stale
+    assert isinstance(Flagged.__fields__["a"].dump_flags, frozenset)
+
+    f.c = 4
+    assert f.dump_to_dict(only_dirty=True) == {"c": 4}
+
+
+def test_item_access():
+    """Fields by name or Field instance, KeyError for anything else
+    """
+    a = AS()
+    assert a['a'] == 1
+    assert a[AS.__fields__['b']] == 'b'
+    a['a'] = 2
+    assert a.a == 2
+
+    for key in ('missing', 3, None, field()):
+        with pytest.raises(KeyError):
+            a[key]
+        with pytest.raises(KeyError):
+            a[key] = 1
+
+
+def test_from_row():
+    """Generated ``__hydrate__`` reads only field columns;
+    ``BaseScheme`` itself falls back to passing the row to ``__init__``
+    """
+    a = AS.from_row({'a': 5, 'unknown': 'x'})
+    assert (a.a, a.b) == (5, 'b')
+
+    assert isinstance(BaseScheme.from_row({}), BaseScheme)
@@ -0,0 +1,34 @@
+"""Tests for task.handler.TaskHandler
+"""
+
+from blue_firmament.log import get_logger
+from blue_firmament.task import TaskID, Method, TaskHandler
+from blue_firmament.task.main import Task
+from blue_firmament.task.result import TaskResult, JsonBody
+from blue_firmament.task.context import BaseTaskContext
+
+
+async def test_inject_task_and_result():
+    """Task, TaskResult are taken from task context,
+    other parameters from path / task parameters
+    """
+    got = {}
+
+    async def inner(task: Task, result: TaskResult, id: int):
+        got.update(task=task, result=result, id=id)
+        return {'id': id}
+
+    task = Task(TaskID(Method.GET, '/items/1'), parameters={'id': '1'})
+    task_result = TaskResult()
+    task_context = BaseTaskContext(
+        task=task, task_result=task_result, base_logger=get_logger('test')
+    )
+
+    body = await TaskHandler(inner)(task_context=task_context, path_params={})
+    assert got['task'] is task
+    assert got['result'] is task_result
+    assert got['id'] == 1
+    assert isinstance(body, JsonBody)
+
+    await TaskHandler(inner)(task_context=task_context, path_params={'id': '2'})
+    assert got['id'] == 2  # path params first
@@ -0,0 +1,24 @@
+"""Tests for task.main.TaskID
+"""
+
+from blue_firmament.task import TaskID, Method
+
+
+class TestTaskID:
+
+    def test_is_match(self):
+        """
+        - static: segments equal
+        - dynamic: parameters resolved and converted
+        - method: None is wildcard
+        """
+        assert TaskID(Method.GET, '/a/b').is_match(TaskID(Method.GET, '/a/b')) == {}
+        assert TaskID(Method.GET, '/a/b').is_match(TaskID(Method.GET, '/a/c')) is None
+        assert TaskID(Method.GET, '/a/b').is_match(TaskID(Method.POST, '/a/b')) is None
+
+        tid = TaskID(Method.GET, '/users/{id}', param_types={'id': int})
+        assert tid.is_match(TaskID(Method.GET, '/users/3')) == {'id': 3}
+        assert tid.is_match(TaskID(Method.GET, '/users/x')) is None
+        assert tid.is_match(TaskID(Method.GET, '/users/3/posts')) is None
+
+        assert TaskID(None, '/a/{b}').is_match(TaskID(Method.POST, '/a/c')) == {'b': 'c'}
@@ -0,0 +1,109 @@
+"""Tests for task.registry.TaskRegistry
+"""
+
+from blue_firmament.task import TaskID, Method
+from blue_firmament.task.registry import TaskEntry, TaskRegistry
+
+
+class CountingEntry(TaskEntry):
+    """TaskEntry counting dynamic match attempts"""
+
+    def __init__(self, task_id: TaskID) -> None:
+        super().__init__(task_id)
+        self.match_calls = 0
+
+    def is_match(self, task_id: TaskID):
+        self.match_calls += 1
+        return super().is_match(task_id)
+
+
+def users(id: str) -> TaskID:
+    return TaskID(Method.GET, f'/users/{id}')
+
+
+class TestTaskRegistry:
+
+    def test_static_entries(self):
+        """
+        - static entries are looked up by TaskID
+        - ``static_entries`` is a set of entries
+        """
+        registry = TaskRegistry()
+        entry = TaskEntry(TaskID(Method.GET, '/a/b'))
+        registry.add_entry(entry)
+
+        assert registry.lookup(TaskID(Method.GET, '/a/b')) is entry
+        assert registry.static_entries == {entry}
+        assert isinstance(registry.static_entries, set)
+
+    def test_lookup_cache(self):
+        """
+        - hit skips matching, still returns a fresh copy with path params
+        - least recently used evicted beyond ``lookup_cache_size``
+        """
+        registry = TaskRegistry(lookup_cache_size=2)
+        entry = CountingEntry(users('{id}'))
+        registry.add_entry(entry)
+
+        first = registry.lookup(users('1'))
+        assert first.path_params == {'id': '1'}
+        assert entry.match_calls == 1
+        second = registry.lookup(users('1'))
+        assert second.path_params == {'id': '1'}
+        assert second is not first
+        assert entry.match_calls == 1  # hit
+
+        registry.lookup(users('2'))
+        registry.lookup(users('1'))  # hit, 1 becomes most recent
+        registry.lookup(users('3'))  # evicts 2
+        assert entry.match_calls == 3
+        registry.lookup(users('1'))
+        assert entry.match_calls == 3
+        assert registry.lookup(users('2')).path_params == {'id': '2'}
+        assert entry.match_calls == 4  # miss
+
+    def test_lookup_cache_disabled(self):
+        registry = TaskRegistry(lookup_cache_size=0)
+        entry = CountingEntry(users('{id}'))
+        registry.add_entry(entry)
+
+        registry.lookup(users('1'))
+        registry.lookup(users('1'))
+        assert entry.match_calls == 2
+
+    def test_lookup_cache_invalidation(self):
+        """Adding or merging entries drops cached lookups
+        """
+        registry = TaskRegistry(lookup_cache_size=8)
+        entry = CountingEntry(users('{id}'))
+        registry.add_entry(entry)
+        registry.lookup(users('1'))
+
+        registry.add_entry(TaskEntry(TaskID(Method.POST, '/users/{id}')))
+        assert registry.lookup(users('1')).path_params == {'id': '1'}
+        assert entry.match_calls == 2
+
+        to_merge = TaskRegistry()
+        static = TaskEntry(users('1'))
+        to_merge.add_entry(static)
+        registry.merge(to_merge)
+        assert registry.lookup(users('1')).is_dynamic() is False
+        assert entry.match_calls == 2
+        assert registry.lookup(users('2')).path_params == {'id': '2'}
+        assert entry.match_calls == 3
+
+    def test_duplicate_static_entry(self):
+        """First registered entry of a TaskID is kept
+        (re-registering or merging never swaps a mounted route)
+        """
+        registry = TaskRegistry()
+        first = TaskEntry(TaskID(Method.GET, '/a/b'))
+        registry.add_entry(first)
+        registry.add_entry(TaskEntry(TaskID(Method.GET, '/a/b')))
+        assert registry.lookup(TaskID(Method.GET, '/a/b')) is first
+
+        to_merge = TaskRegistry()
+        to_merge.add_entry(TaskEntry(TaskID(Method.GET, '/a/b')))
+        registry.merge(to_merge)
+        assert registry.lookup(TaskID(Method.GET, '/a/b')) is first
+        assert len(registry.static_entries) == 1